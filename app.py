@@ -12,26 +12,21 @@ To run: streamlit run app.py
 """
 
 import streamlit as st
-import json
-import random
-import os
-import base64
-import csv
+import re
 from datetime import datetime
-from pathlib import Path
-from io import StringIO
-
-# ============================================================
-# CONFIGURATION
-# ============================================================
-
-QUESTIONS_FILE = "questions.json"
-RESPONSES_DIR = "responses"
-VIDEOS_DIR = "responses/videos"
-
-# Create directories
-Path(RESPONSES_DIR).mkdir(exist_ok=True)
-Path(VIDEOS_DIR).mkdir(exist_ok=True)
+from functools import lru_cache
+from string import Template
+
+from interview_sim.core import (
+    questions_mtime,
+    load_questions,
+    select_session_questions,
+    save_session_response,
+    load_all_sessions,
+    get_ai_feedback_batch,
+    export_sessions_to_csv,
+)
+from interview_sim.styles import inject_css, logo
 
 # ============================================================
 # PAGE CONFIG
@@ -48,304 +43,27 @@ st.set_page_config(
 # CUSTOM CSS
 # ============================================================
 
-st.markdown("""
-<style>
-    /* Main styling */
-    .main-header {
-        background: linear-gradient(135deg, #1e3a5f 0%, #2d5a87 100%);
-        padding: 2rem;
-        border-radius: 15px;
-        color: white;
-        margin-bottom: 2rem;
-        text-align: center;
-    }
-    
-    .question-card {
-        background: linear-gradient(145deg, #f8fafc 0%, #e2e8f0 100%);
-        padding: 2rem;
-        border-radius: 15px;
-        border-left: 5px solid #3b82f6;
-        margin: 1.5rem 0;
-        box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
-    }
-    
-    .question-card-video {
-        background: linear-gradient(145deg, #fef3f2 0%, #fee2e2 100%);
-        border-left: 5px solid #ef4444;
-    }
-    
-    .category-badge {
-        background: #3b82f6;
-        color: white;
-        padding: 0.3rem 0.8rem;
-        border-radius: 20px;
-        font-size: 0.8rem;
-        display: inline-block;
-        margin-bottom: 0.5rem;
-    }
-    
-    .timer-display {
-        font-size: 4rem;
-        font-weight: bold;
-        text-align: center;
-        color: #ef4444;
-        font-family: 'Courier New', monospace;
-        padding: 1rem;
-        background: #1a1a2e;
-        border-radius: 10px;
-        margin: 1rem 0;
-    }
-    
-    .success-card {
-        background: linear-gradient(145deg, #ecfdf5 0%, #d1fae5 100%);
-        padding: 2rem;
-        border-radius: 15px;
-        border-left: 5px solid #10b981;
-        margin: 1rem 0;
-    }
-    
-    .feedback-card {
-        background: linear-gradient(145deg, #fffbeb 0%, #fef3c7 100%);
-        padding: 1.5rem;
-        border-radius: 10px;
-        border-left: 4px solid #f59e0b;
-        margin: 1rem 0;
-    }
-    
-    .stats-card {
-        background: white;
-        padding: 1.5rem;
-        border-radius: 10px;
-        box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        text-align: center;
-    }
-    
-    .recording-indicator {
-        display: inline-block;
-        width: 12px;
-        height: 12px;
-        background: #ef4444;
-        border-radius: 50%;
-        margin-right: 8px;
-        animation: pulse 1s infinite;
-    }
-    
-    @keyframes pulse {
-        0%, 100% { opacity: 1; }
-        50% { opacity: 0.5; }
-    }
-    
-    /* Hide Streamlit branding */
-    #MainMenu {visibility: hidden;}
-    footer {visibility: hidden;}
-</style>
-""", unsafe_allow_html=True)
+inject_css()
 
 # ============================================================
-# HELPER FUNCTIONS
+# VIDEO RECORDING COMPONENT
 # ============================================================
 
-def load_questions():
-    """Load questions from JSON file."""
-    try:
-        with open(QUESTIONS_FILE, 'r') as f:
-            data = json.load(f)
-            return data['questions']
-    except FileNotFoundError:
-        st.error(f"❌ Questions file not found: {QUESTIONS_FILE}")
-        return []
-
-
-def select_session_questions(all_questions, typed_count=5, video_count=5):
-    """Randomly select questions for a practice session."""
-    typed_eligible = [q for q in all_questions if q['type'] in ['typed', 'both']]
-    video_eligible = [q for q in all_questions if q['type'] in ['video', 'both']]
-    
-    def group_by_category(questions):
-        groups = {}
-        for q in questions:
-            cat = q['category']
-            if cat not in groups:
-                groups[cat] = []
-            groups[cat].append(q)
-        return groups
-    
-    typed_by_cat = group_by_category(typed_eligible)
-    video_by_cat = group_by_category(video_eligible)
-    
-    typed_quotas = {'A': 2, 'B': 1, 'C': 1, 'D': 1}
-    video_quotas = {'A': 1, 'B': 2, 'C': 1, 'D': 1}
-    
-    selected_typed = []
-    selected_video = []
-    used_ids = set()
-    
-    for category, quota in typed_quotas.items():
-        if category in typed_by_cat:
-            available = [q for q in typed_by_cat[category] if q['id'] not in used_ids]
-            chosen = random.sample(available, min(quota, len(available)))
-            selected_typed.extend(chosen)
-            used_ids.update(q['id'] for q in chosen)
-    
-    for category, quota in video_quotas.items():
-        if category in video_by_cat:
-            available = [q for q in video_by_cat[category] if q['id'] not in used_ids]
-            chosen = random.sample(available, min(quota, len(available)))
-            selected_video.extend(chosen)
-            used_ids.update(q['id'] for q in chosen)
-    
-    random.shuffle(selected_typed)
-    random.shuffle(selected_video)
-    
-    return {
-        'typed': selected_typed[:typed_count],
-        'video': selected_video[:video_count]
-    }
-
-
-def save_session_response(student_name, session_data):
-    """Save the student's responses to a JSON file."""
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    safe_name = "".join(c for c in student_name if c.isalnum() or c in (' ', '-', '_')).strip()
-    safe_name = safe_name.replace(' ', '_')
-    filename = f"{RESPONSES_DIR}/{timestamp}_{safe_name}.json"
-    
-    save_data = {
-        'student_name': student_name,
-        'session_id': f"{timestamp}_{safe_name}",
-        'session_timestamp': datetime.now().isoformat(),
-        'typed_responses': session_data.get('typed_responses', []),
-        'video_responses': session_data.get('video_responses', []),
-        'ai_feedback': session_data.get('ai_feedback', [])
-    }
-    
-    with open(filename, 'w') as f:
-        json.dump(save_data, f, indent=2)
-    
-    return filename
-
-
-def load_all_sessions():
-    """Load all saved session files for teacher review."""
-    sessions = []
-    if os.path.exists(RESPONSES_DIR):
-        for filename in os.listdir(RESPONSES_DIR):
-            if filename.endswith('.json'):
-                filepath = os.path.join(RESPONSES_DIR, filename)
-                try:
-                    with open(filepath, 'r') as f:
-                        data = json.load(f)
-                        data['filename'] = filename
-                        sessions.append(data)
-                except:
-                    pass
-    # Sort by timestamp, newest first
-    sessions.sort(key=lambda x: x.get('session_timestamp', ''), reverse=True)
-    return sessions
-
-
-def save_video_file(video_data_b64, session_id, question_id):
-    """Save base64 encoded video to file."""
-    try:
-        video_data = base64.b64decode(video_data_b64.split(',')[1] if ',' in video_data_b64 else video_data_b64)
-        filename = f"{VIDEOS_DIR}/{session_id}_{question_id}.webm"
-        with open(filename, 'wb') as f:
-            f.write(video_data)
-        return filename
-    except Exception as e:
-        return None
-
-
-def get_ai_feedback(question, response, api_key):
-    """Get AI feedback on a response using Claude API."""
-    try:
-        import anthropic
-        
-        client = anthropic.Anthropic(api_key=api_key)
-        
-        prompt = f"""You are a helpful interview coach providing feedback to a secondary school student 
-practicing for a retail job interview at Woolworths Australia.
-
-The student was asked: "{question}"
+def _minify_html(markup):
+    """Drop whole-line // comments and collapse whitespace in inline HTML/JS."""
+    markup = re.sub(r'^\s*//.*$', '', markup, flags=re.MULTILINE)
+    return re.sub(r'\s+', ' ', markup).strip()
 
-Their response was: "{response}"
 
-Please provide brief, encouraging feedback (3-4 sentences) that:
-1. Highlights one thing they did well
-2. Suggests one specific improvement
-3. Gives a concrete tip for their next attempt
-
-Keep your tone friendly and supportive - remember they're a student, likely nervous about their first job interview.
-"""
-        
-        message = client.messages.create(
-            model="claude-sonnet-4-20250514",
-            max_tokens=300,
-            messages=[
-                {"role": "user", "content": prompt}
-            ]
-        )
-        
-        return message.content[0].text
-    
-    except ImportError:
-        return "⚠️ AI feedback requires the 'anthropic' package. Install with: pip install anthropic"
-    except Exception as e:
-        return f"⚠️ Could not generate AI feedback: {str(e)}"
-
-
-def export_sessions_to_csv(sessions):
-    """Export sessions to CSV format."""
-    output = StringIO()
-    writer = csv.writer(output)
-    
-    # Header
-    writer.writerow([
-        'Student Name', 'Session Date', 'Question Type', 'Question ID',
-        'Question', 'Response', 'AI Feedback'
-    ])
-    
-    for session in sessions:
-        student = session.get('student_name', 'Unknown')
-        timestamp = session.get('session_timestamp', '')[:10]
-        
-        # Typed responses
-        for resp in session.get('typed_responses', []):
-            writer.writerow([
-                student, timestamp, 'Typed', resp.get('question_id', ''),
-                resp.get('question', ''), resp.get('response', ''),
-                resp.get('ai_feedback', '')
-            ])
-        
-        # Video responses
-        for resp in session.get('video_responses', []):
-            writer.writerow([
-                student, timestamp, 'Video', resp.get('question_id', ''),
-                resp.get('question', ''), '[Video Recording]',
-                resp.get('notes', '')
-            ])
-    
-    return output.getvalue()
-
-
-# ============================================================
-# VIDEO RECORDING COMPONENT
-# ============================================================
-
-def video_recorder_component(question_text, time_limit=60):
-    """
-    Custom HTML/JS component for video recording.
-    Returns the recorded video as base64 when complete.
-    """
-    
-    component_html = f"""
+# Recorder markup, minified once at import; $time_limit is the only placeholder
+_VIDEO_HTML_TEMPLATE = Template(_minify_html("""
     <div id="video-container" style="text-align: center; font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;">
         <div style="background: #1a1a2e; padding: 20px; border-radius: 15px; margin-bottom: 20px;">
             <video id="preview" autoplay muted playsinline style="width: 100%; max-width: 640px; border-radius: 10px; background: #000;"></video>
         </div>
         
         <div id="timer" style="font-size: 3rem; font-weight: bold; color: #ef4444; font-family: 'Courier New', monospace; margin: 20px 0;">
-            {time_limit}
+            $time_limit
         </div>
         
         <div id="status" style="margin: 15px 0; padding: 10px; border-radius: 8px; background: #f0f0f0;">
@@ -381,59 +99,55 @@ def video_recorder_component(question_text, time_limit=60):
                 </button>
             </div>
         </div>
-        
-        <input type="hidden" id="videoData" name="videoData">
     </div>
     
     <script>
         let mediaRecorder;
         let recordedChunks = [];
+        let recordedBuffer = null;
         let stream;
         let timerInterval;
-        let timeLeft = {time_limit};
+        let timeLeft = $time_limit;
         
         // Initialize camera on load
-        async function initCamera() {{
-            try {{
-                stream = await navigator.mediaDevices.getUserMedia({{ 
-                    video: {{ facingMode: "user", width: 1280, height: 720 }}, 
+        async function initCamera() {
+            try {
+                stream = await navigator.mediaDevices.getUserMedia({ 
+                    video: { facingMode: "user", width: 1280, height: 720 }, 
                     audio: true 
-                }});
+                });
                 document.getElementById('preview').srcObject = stream;
                 document.getElementById('status').innerHTML = '✅ Camera ready! Click "Start Recording" when ready.';
                 document.getElementById('status').style.background = '#d1fae5';
-            }} catch (err) {{
+            } catch (err) {
                 document.getElementById('status').innerHTML = '❌ Camera access denied. Please allow camera access and refresh.';
                 document.getElementById('status').style.background = '#fee2e2';
                 console.error('Camera error:', err);
-            }}
-        }}
+            }
+        }
         
-        function startRecording() {{
+        function startRecording() {
             recordedChunks = [];
-            timeLeft = {time_limit};
+            recordedBuffer = null;
+            timeLeft = $time_limit;
             
-            mediaRecorder = new MediaRecorder(stream, {{ mimeType: 'video/webm;codecs=vp9,opus' }});
+            mediaRecorder = new MediaRecorder(stream, { mimeType: 'video/webm;codecs=vp9,opus' });
             
-            mediaRecorder.ondataavailable = (event) => {{
-                if (event.data.size > 0) {{
+            mediaRecorder.ondataavailable = (event) => {
+                if (event.data.size > 0) {
                     recordedChunks.push(event.data);
-                }}
-            }};
+                }
+            };
             
-            mediaRecorder.onstop = () => {{
-                const blob = new Blob(recordedChunks, {{ type: 'video/webm' }});
+            mediaRecorder.onstop = async () => {
+                const blob = new Blob(recordedChunks, { type: 'video/webm' });
                 const url = URL.createObjectURL(blob);
                 document.getElementById('playback').src = url;
                 document.getElementById('playback-container').style.display = 'block';
                 
-                // Convert to base64
-                const reader = new FileReader();
-                reader.onloadend = () => {{
-                    document.getElementById('videoData').value = reader.result;
-                }};
-                reader.readAsDataURL(blob);
-            }};
+                // Keep the raw bytes; they are handed over as-is on submit
+                recordedBuffer = await blob.arrayBuffer();
+            };
             
             mediaRecorder.start(1000);
             
@@ -446,24 +160,24 @@ def video_recorder_component(question_text, time_limit=60):
             document.getElementById('playback-container').style.display = 'none';
             
             // Start timer
-            timerInterval = setInterval(() => {{
+            timerInterval = setInterval(() => {
                 timeLeft--;
                 document.getElementById('timer').textContent = timeLeft;
                 
-                if (timeLeft <= 10) {{
+                if (timeLeft <= 10) {
                     document.getElementById('timer').style.color = '#ef4444';
-                }}
+                }
                 
-                if (timeLeft <= 0) {{
+                if (timeLeft <= 0) {
                     stopRecording();
-                }}
-            }}, 1000);
-        }}
+                }
+            }, 1000);
+        }
         
-        function stopRecording() {{
-            if (mediaRecorder && mediaRecorder.state !== 'inactive') {{
+        function stopRecording() {
+            if (mediaRecorder && mediaRecorder.state !== 'inactive') {
                 mediaRecorder.stop();
-            }}
+            }
             clearInterval(timerInterval);
             
             document.getElementById('startBtn').disabled = false;
@@ -473,41 +187,58 @@ def video_recorder_component(question_text, time_limit=60):
             document.getElementById('status').innerHTML = '✅ Recording complete! Review below.';
             document.getElementById('status').style.background = '#d1fae5';
             document.getElementById('timer').style.color = '#10b981';
-        }}
+        }
         
-        function retryRecording() {{
+        function retryRecording() {
             document.getElementById('playback-container').style.display = 'none';
-            document.getElementById('timer').textContent = '{time_limit}';
+            document.getElementById('timer').textContent = '$time_limit';
             document.getElementById('timer').style.color = '#ef4444';
             document.getElementById('status').innerHTML = 'Ready to record again. Click "Start Recording".';
             document.getElementById('status').style.background = '#f0f0f0';
-        }}
-        
-        function submitRecording() {{
-            const videoData = document.getElementById('videoData').value;
-            if (videoData) {{
-                // Send to Streamlit via query params (workaround)
-                window.parent.postMessage({{
+        }
+        
+        function submitRecording() {
+            if (recordedBuffer) {
+                // Component-protocol message, transferring the buffer rather
+                // than copying it. st.components.v1.html is display-only, so
+                // Python only receives this once the recorder is served as a
+                // bidirectional component.
+                window.parent.postMessage({
+                    isStreamlitMessage: true,
                     type: 'streamlit:setComponentValue',
-                    value: videoData
-                }}, '*');
+                    value: new Uint8Array(recordedBuffer),
+                    dataType: 'bytes'
+                }, '*', [recordedBuffer]);
+                recordedBuffer = null;
                 
                 document.getElementById('status').innerHTML = '✅ Recording submitted! Click "Next Question" to continue.';
                 document.getElementById('status').style.background = '#d1fae5';
-            }}
-        }}
+            }
+        }
         
         // CSS for pulse animation
         const style = document.createElement('style');
-        style.textContent = '@keyframes pulse {{ 0%, 100% {{ opacity: 1; }} 50% {{ opacity: 0.5; }} }}';
+        style.textContent = '@keyframes pulse { 0%, 100% { opacity: 1; } 50% { opacity: 0.5; } }';
         document.head.appendChild(style);
         
         // Initialize
         initCamera();
     </script>
+"""))
+
+
+@lru_cache(maxsize=8)
+def _video_html(time_limit):
+    return _VIDEO_HTML_TEMPLATE.substitute(time_limit=time_limit)
+
+
+def video_recorder_component(question_text, time_limit=60):
     """
-    
-    return component_html
+    Custom HTML/JS component for video recording.
+    Rendered with st.components.v1.html, which is display-only: the
+    submitted recording is posted to the page but not returned to Python.
+    """
+    return _video_html(time_limit)
 
 
 # ============================================================
@@ -594,8 +325,7 @@ def show_student_welcome():
         st.session_state.session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
         
         # Select random questions
-        all_questions = load_questions()
-        st.session_state.session_questions = select_session_questions(all_questions)
+        st.session_state.session_questions = select_session_questions(load_questions(questions_mtime()))
         
         st.rerun()
 
@@ -617,14 +347,14 @@ def show_typed_questions():
         # Question card
         st.markdown(f"""
         <div class="question-card">
-            <span class="category-badge">{question['category_name']}</span>
-            <h3 style="margin-top: 10px;">{question['question']}</h3>
+            <span class="category-badge">{question.category_name}</span>
+            <h3 style="margin-top: 10px;">{question.question}</h3>
         </div>
         """, unsafe_allow_html=True)
         
         # Tips
         with st.expander("💡 Tips for this question"):
-            st.write(question.get('tips', 'Take your time and be authentic!'))
+            st.write(question.tips or 'Take your time and be authentic!')
         
         # Response area
         response = st.text_area(
@@ -646,23 +376,13 @@ def show_typed_questions():
                 if st.button("Next Question →", type="primary", disabled=not response.strip()):
                     # Save response
                     response_data = {
-                        'question_id': question['id'],
-                        'question': question['question'],
+                        'question_id': question.id,
+                        'question': question.question,
                         'response': response,
                         'word_count': word_count,
                         'timestamp': datetime.now().isoformat()
                     }
                     
-                    # Get AI feedback if enabled
-                    if st.session_state.api_key:
-                        with st.spinner("Getting AI feedback..."):
-                            feedback = get_ai_feedback(
-                                question['question'],
-                                response,
-                                st.session_state.api_key
-                            )
-                            response_data['ai_feedback'] = feedback
-                    
                     st.session_state.typed_responses.append(response_data)
                     st.session_state.current_question += 1
                     st.rerun()
@@ -670,23 +390,22 @@ def show_typed_questions():
                 if st.button("Continue to Video Questions →", type="primary", disabled=not response.strip()):
                     # Save final typed response
                     response_data = {
-                        'question_id': question['id'],
-                        'question': question['question'],
+                        'question_id': question.id,
+                        'question': question.question,
                         'response': response,
                         'word_count': word_count,
                         'timestamp': datetime.now().isoformat()
                     }
+                    st.session_state.typed_responses.append(response_data)
                     
+                    # Get AI feedback for the whole typed phase in one batch
                     if st.session_state.api_key:
+                        responses = st.session_state.typed_responses
                         with st.spinner("Getting AI feedback..."):
-                            feedback = get_ai_feedback(
-                                question['question'],
-                                response,
-                                st.session_state.api_key
-                            )
-                            response_data['ai_feedback'] = feedback
+                            feedback = get_ai_feedback_batch(responses, st.session_state.api_key)
+                        for r, text in zip(responses, feedback):
+                            r['ai_feedback'] = text
                     
-                    st.session_state.typed_responses.append(response_data)
                     st.session_state.phase = 'video_intro'
                     st.session_state.current_question = 0
                     st.rerun()
@@ -754,20 +473,20 @@ def show_video_questions():
         # Question card (larger for video)
         st.markdown(f"""
         <div class="question-card question-card-video">
-            <span class="category-badge" style="background: #ef4444;">{question['category_name']}</span>
-            <h2 style="margin-top: 15px; font-size: 1.5rem;">{question['question']}</h2>
+            <span class="category-badge" style="background: #ef4444;">{question.category_name}</span>
+            <h2 style="margin-top: 15px; font-size: 1.5rem;">{question.question}</h2>
         </div>
         """, unsafe_allow_html=True)
         
         # Tips
         with st.expander("💡 Tips for this question"):
-            st.write(question.get('tips', 'Take a breath, then start speaking confidently!'))
+            st.write(question.tips or 'Take a breath, then start speaking confidently!')
         
         # Video recorder
         st.markdown("### Your Recording")
         
         # Use iframe for video component (simpler approach)
-        video_html = video_recorder_component(question['question'], time_limit=60)
+        video_html = video_recorder_component(question.question, time_limit=60)
         st.components.v1.html(video_html, height=700)
         
         # Self-assessment notes
@@ -788,8 +507,8 @@ def show_video_questions():
             if current_idx < len(questions) - 1:
                 if st.button("Next Question →", type="primary"):
                     st.session_state.video_responses.append({
-                        'question_id': question['id'],
-                        'question': question['question'],
+                        'question_id': question.id,
+                        'question': question.question,
                         'notes': notes,
                         'timestamp': datetime.now().isoformat()
                     })
@@ -798,8 +517,8 @@ def show_video_questions():
             else:
                 if st.button("Complete Practice Session →", type="primary"):
                     st.session_state.video_responses.append({
-                        'question_id': question['id'],
-                        'question': question['question'],
+                        'question_id': question.id,
+                        'question': question.question,
                         'notes': notes,
                         'timestamp': datetime.now().isoformat()
                     })
@@ -1008,7 +727,7 @@ def main():
     
     # Sidebar navigation
     with st.sidebar:
-        st.image("https://upload.wikimedia.org/wikipedia/en/thumb/f/f5/Woolworths_logo.svg/200px-Woolworths_logo.svg.png", width=150)
+        st.image(logo(), width=150)
         st.markdown("---")
         
         mode = st.radio(
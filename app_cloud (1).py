@@ -8,23 +8,28 @@ To run: streamlit run app_cloud.py
 """
 
 import streamlit as st
-import json
+import html
 import random
-import os
-import csv
 from datetime import datetime
-from pathlib import Path
-from io import StringIO, BytesIO
+from string import Template
 import time
 
+from interview_sim.core import (
+    questions_mtime,
+    load_questions,
+    save_session_response,
+    load_session_index,
+    load_session,
+    get_ai_feedback_batch,
+    export_sessions_to_csv,
+)
+from interview_sim.styles import inject_css
+
 # ============================================================
 # CONFIGURATION
 # ============================================================
 
-QUESTIONS_FILE = "questions.json"
-RESPONSES_DIR = "responses"
-
-Path(RESPONSES_DIR).mkdir(exist_ok=True)
+SESSIONS_PER_PAGE = 20
 
 # ============================================================
 # PAGE CONFIG & STYLING
@@ -37,229 +42,134 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-st.markdown("""
-<style>
-    .main-header {
-        background: linear-gradient(135deg, #1e3a5f 0%, #2d5a87 100%);
-        padding: 2rem;
-        border-radius: 15px;
-        color: white;
-        margin-bottom: 2rem;
-        text-align: center;
-    }
-    
-    .question-card {
-        background: linear-gradient(145deg, #f8fafc 0%, #e2e8f0 100%);
-        padding: 2rem;
-        border-radius: 15px;
-        border-left: 5px solid #3b82f6;
-        margin: 1.5rem 0;
-        box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
-    }
-    
-    .question-card-video {
-        background: linear-gradient(145deg, #fef3f2 0%, #fee2e2 100%);
-        border-left: 5px solid #ef4444;
-    }
-    
-    .category-badge {
-        background: #3b82f6;
-        color: white;
-        padding: 0.3rem 0.8rem;
-        border-radius: 20px;
-        font-size: 0.8rem;
-        display: inline-block;
-        margin-bottom: 0.5rem;
-    }
-    
-    .timer-big {
-        font-size: 5rem;
-        font-weight: bold;
-        text-align: center;
-        font-family: 'Courier New', monospace;
-        padding: 2rem;
-        background: linear-gradient(145deg, #1a1a2e 0%, #16213e 100%);
-        border-radius: 20px;
-        margin: 1.5rem 0;
-    }
-    
-    .timer-green { color: #10b981; }
-    .timer-yellow { color: #f59e0b; }
-    .timer-red { color: #ef4444; }
-    
-    .feedback-card {
-        background: linear-gradient(145deg, #fffbeb 0%, #fef3c7 100%);
-        padding: 1.5rem;
-        border-radius: 10px;
-        border-left: 4px solid #f59e0b;
-        margin: 1rem 0;
-    }
-    
-    .success-banner {
-        background: linear-gradient(145deg, #ecfdf5 0%, #d1fae5 100%);
-        padding: 2rem;
-        border-radius: 15px;
-        text-align: center;
-        margin: 1rem 0;
-    }
-    
-    .stats-card {
-        background: white;
-        padding: 1.2rem;
-        border-radius: 10px;
-        box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        text-align: center;
-        height: 100%;
-    }
-    
-    .instruction-step {
-        background: #f8fafc;
-        padding: 1rem;
-        border-radius: 8px;
-        margin: 0.5rem 0;
-        border-left: 3px solid #3b82f6;
-    }
-</style>
-""", unsafe_allow_html=True)
+inject_css()
 
 # ============================================================
 # HELPER FUNCTIONS
 # ============================================================
 
-def load_questions():
-    """Load questions from JSON file."""
-    try:
-        with open(QUESTIONS_FILE, 'r') as f:
-            data = json.load(f)
-            return data['questions']
-    except FileNotFoundError:
-        st.error(f"❌ Questions file not found: {QUESTIONS_FILE}")
-        return get_default_questions()
-
-
-def get_default_questions():
-    """Return default questions if file not found."""
-    return [
-        {"id": "A1", "category": "A", "category_name": "Personal & Motivation",
-         "question": "Tell us about yourself and what interests you about working in retail.",
-         "type": "both", "tips": "Keep it professional. Mention your interests and why retail appeals to you."},
-        {"id": "B1", "category": "B", "category_name": "Customer Service",
-         "question": "What does excellent customer service mean to you?",
-         "type": "both", "tips": "Think about making customers feel valued and solving their problems."},
-    ]
-
-
-def select_session_questions(all_questions, typed_count=5, video_count=5):
-    """Randomly select questions for a practice session."""
-    typed_eligible = [q for q in all_questions if q['type'] in ['typed', 'both']]
-    video_eligible = [q for q in all_questions if q['type'] in ['video', 'both']]
-    
-    # Shuffle and select
-    random.shuffle(typed_eligible)
-    random.shuffle(video_eligible)
+def select_session_questions(pools, typed_count=5, video_count=5):
+    """Randomly select questions for a practice session from ``load_questions()`` pools."""
+    typed_eligible = pools['typed']
+    selected_typed = random.sample(typed_eligible, min(typed_count, len(typed_eligible)))
+    used_ids = {q.id for q in selected_typed}
     
     # Ensure no overlap
-    selected_typed = typed_eligible[:typed_count]
-    used_ids = {q['id'] for q in selected_typed}
-    
-    selected_video = [q for q in video_eligible if q['id'] not in used_ids][:video_count]
+    video_available = [q for q in pools['video'] if q.id not in used_ids]
+    selected_video = random.sample(video_available, min(video_count, len(video_available)))
     
     return {'typed': selected_typed, 'video': selected_video}
 
 
-def save_session(student_name, data):
-    """Save session data to JSON file."""
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    safe_name = "".join(c for c in student_name if c.isalnum() or c == ' ').strip().replace(' ', '_')
-    filename = f"{RESPONSES_DIR}/{timestamp}_{safe_name}.json"
-    
-    save_data = {
-        'student_name': student_name,
-        'session_timestamp': datetime.now().isoformat(),
-        'typed_responses': data.get('typed_responses', []),
-        'video_responses': data.get('video_responses', [])
-    }
-    
-    with open(filename, 'w') as f:
-        json.dump(save_data, f, indent=2)
-    return filename
-
-
-def load_all_sessions():
-    """Load all saved sessions."""
-    sessions = []
-    if os.path.exists(RESPONSES_DIR):
-        for filename in os.listdir(RESPONSES_DIR):
-            if filename.endswith('.json'):
-                try:
-                    with open(os.path.join(RESPONSES_DIR, filename), 'r') as f:
-                        data = json.load(f)
-                        data['filename'] = filename
-                        sessions.append(data)
-                except:
-                    pass
-    sessions.sort(key=lambda x: x.get('session_timestamp', ''), reverse=True)
-    return sessions
-
-
-def get_ai_feedback(question, response, api_key):
-    """Get AI feedback on a response."""
-    try:
-        import anthropic
-        client = anthropic.Anthropic(api_key=api_key)
-        
-        message = client.messages.create(
-            model="claude-sonnet-4-20250514",
-            max_tokens=300,
-            messages=[{
-                "role": "user",
-                "content": f"""You're a friendly interview coach helping a secondary school student practice for a retail job interview.
-
-Question: "{question}"
-Student's response: "{response}"
-
-Give brief, encouraging feedback (3-4 sentences):
-1. One thing they did well
-2. One specific improvement suggestion
-3. A practical tip for next time
-
-Keep it warm and supportive!"""
-            }]
-        )
-        return message.content[0].text
-    except ImportError:
-        return "💡 Install the 'anthropic' package for AI feedback: pip install anthropic"
-    except Exception as e:
-        return f"⚠️ Couldn't get feedback: {str(e)}"
+def reset_session(**restore):
+    """Clear the practice session, keeping the sidebar mode, then apply ``restore``.
 
+    ``app_mode`` belongs to a widget that has already rendered this run, so it
+    can't be cleared and re-assigned; everything else goes in one pass.
+    """
+    for key in st.session_state.keys() - {'app_mode'}:
+        del st.session_state[key]
+    st.session_state.update(restore)
 
-def export_to_csv(sessions):
-    """Export sessions to CSV."""
-    output = StringIO()
-    writer = csv.writer(output)
-    writer.writerow(['Student', 'Date', 'Type', 'Question', 'Response', 'Feedback'])
-    
-    for session in sessions:
-        student = session.get('student_name', 'Unknown')
-        date = session.get('session_timestamp', '')[:10]
+
+# ============================================================
+# TIMER COMPONENT
+# ============================================================
+
+def countdown_timer_component(seconds):
+    """
+    Self-contained HTML/JS countdown for the video practice timer.
+    Runs entirely in the browser so the script doesn't rerun every second.
+    """
+    return f"""
+    <style>
+        .timer-big {{
+            font-size: 5rem;
+            font-weight: bold;
+            text-align: center;
+            font-family: 'Courier New', monospace;
+            padding: 2rem;
+            background: linear-gradient(145deg, #1a1a2e 0%, #16213e 100%);
+            border-radius: 20px;
+            margin: 0;
+        }}
+        .timer-green {{ color: #10b981; }}
+        .timer-yellow {{ color: #f59e0b; }}
+        .timer-red {{ color: #ef4444; }}
+        #timer-done {{
+            display: none;
+            margin-top: 12px;
+            padding: 12px;
+            border-radius: 8px;
+            background: #d1fae5;
+            color: #065f46;
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+        }}
+    </style>
+    
+    <div id="timer" class="timer-big"></div>
+    <div id="timer-done">⏱️ Time's up! How did you go?</div>
+    
+    <script>
+        let timeLeft = {seconds};
+        const timer = document.getElementById('timer');
         
-        for resp in session.get('typed_responses', []):
-            writer.writerow([
-                student, date, 'Typed',
-                resp.get('question', ''),
-                resp.get('response', ''),
-                resp.get('ai_feedback', '')
-            ])
+        function render() {{
+            timer.textContent = timeLeft;
+            timer.className = 'timer-big ' + (timeLeft > 30 ? 'timer-green' : timeLeft > 10 ? 'timer-yellow' : 'timer-red');
+        }}
         
-        for resp in session.get('video_responses', []):
-            writer.writerow([
-                student, date, 'Video',
-                resp.get('question', ''),
-                resp.get('notes', ''),
-                ''
-            ])
-    
-    return output.getvalue()
+        render();
+        const interval = setInterval(() => {{
+            timeLeft--;
+            render();
+            if (timeLeft <= 0) {{
+                clearInterval(interval);
+                document.getElementById('timer-done').style.display = 'block';
+            }}
+        }}, 1000);
+    </script>
+    """
+
+
+# ============================================================
+# HTML TEMPLATES
+# ============================================================
+# Compiled once at import. Fill them with render_html() so question text,
+# names and feedback are escaped rather than injected as markup.
+
+QUESTION_CARD_HTML = Template("""
+<div class="question-card">
+    <span class="category-badge">$category</span>
+    <h3>$question</h3>
+</div>
+""")
+
+VIDEO_QUESTION_CARD_HTML = Template("""
+<div class="question-card question-card-video">
+    <span class="category-badge" style="background:#ef4444;">$category</span>
+    <h2 style="font-size: 1.6rem; margin-top: 15px;">$question</h2>
+</div>
+""")
+
+COMPLETION_BANNER_HTML = Template("""
+<div class="success-banner">
+    <h1>🎉 Awesome Work, $name!</h1>
+    <p>You've completed your practice interview!</p>
+</div>
+""")
+
+FEEDBACK_CARD_HTML = Template("""
+<div class="feedback-card">
+    <strong>🤖 AI Feedback:</strong><br>
+    $feedback
+</div>
+""")
+
+
+def render_html(template, **values):
+    """Fill an HTML template, escaping every value."""
+    return template.substitute({key: html.escape(str(value)) for key, value in values.items()})
 
 
 # ============================================================
@@ -300,7 +210,7 @@ def show_welcome():
     
     with col2:
         st.markdown("""
-        <div class="stats-card">
+        <div class="stats-card stats-card-cloud">
             <h3>📊 Session Info</h3>
             <p><strong>10</strong> Questions</p>
             <p><strong>60 sec</strong> Per Video Q</p>
@@ -328,7 +238,7 @@ def show_welcome():
         st.session_state.q_index = 0
         st.session_state.typed_responses = []
         st.session_state.video_responses = []
-        st.session_state.questions = select_session_questions(load_questions())
+        st.session_state.questions = select_session_questions(load_questions(questions_mtime()))
         st.rerun()
 
 
@@ -342,67 +252,59 @@ def show_typed_questions():
     
     q = questions[idx]
     
-    st.markdown(f"""
-    <div class="question-card">
-        <span class="category-badge">{q['category_name']}</span>
-        <h3>{q['question']}</h3>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(render_html(QUESTION_CARD_HTML, category=q.category_name, question=q.question),
+                unsafe_allow_html=True)
     
     with st.expander("💡 Tips"):
-        st.write(q.get('tips', 'Be authentic and specific!'))
+        st.write(q.tips or 'Be authentic and specific!')
     
-    response = st.text_area("Your answer:", height=200, key=f"typed_{idx}",
-                           placeholder="Type your response here... (aim for 3-5 sentences)")
+    is_last = idx == len(questions) - 1
+    btn_label = "✅ Finish & Continue to Video" if is_last else "✅ Finish & Next Question"
     
-    word_count = len(response.split()) if response else 0
-    st.caption(f"📊 Word count: {word_count}")
-    
-    # Finish button - prominently placed right after text box
-    st.markdown("")  # Small spacer
-    
-    col_a, col_b, col_c = st.columns([1, 2, 1])
-    with col_b:
-        if idx < len(questions) - 1:
-            btn_label = "✅ Finish & Next Question"
-        else:
-            btn_label = "✅ Finish & Continue to Video"
+    # The form only reruns the script on submit, not on every keystroke
+    with st.form(key=f"typed_form_{idx}"):
+        response = st.text_area("Your answer:", height=200, key=f"typed_{idx}",
+                               placeholder="Type your response here... (aim for 3-5 sentences)")
         
-        finish_clicked = st.button(
-            btn_label, 
-            type="primary", 
-            disabled=not response.strip(),
+        submitted = st.form_submit_button(
+            btn_label,
+            type="primary",
             use_container_width=True,
-            key=f"finish_btn_{idx}"
+            on_click=submit_typed_response,
+            args=(q, idx, is_last)
         )
     
-    # Help text
+    if submitted and not response.strip():
+        st.warning("💡 Type your answer above, then click the Finish button to continue.")
+
+
+def submit_typed_response(q, idx, is_last):
+    """Form callback: store the answer and advance before the page reruns."""
+    response = st.session_state[f"typed_{idx}"]
     if not response.strip():
-        st.caption("💡 Type your answer above, then click the Finish button to continue.")
-    
-    # Handle button click
-    if finish_clicked and response.strip():
-        # Save response
-        resp_data = {
-            'question_id': q['id'],
-            'question': q['question'],
-            'response': response,
-            'word_count': word_count
-        }
-        
-        # Get AI feedback if enabled
-        if st.session_state.api_key:
-            with st.spinner("Getting AI feedback..."):
-                resp_data['ai_feedback'] = get_ai_feedback(q['question'], response, st.session_state.api_key)
-        
-        st.session_state.typed_responses.append(resp_data)
-        
-        if idx < len(questions) - 1:
-            st.session_state.q_index += 1
-        else:
-            st.session_state.phase = 'video_intro'
-            st.session_state.q_index = 0
-        st.rerun()
+        return
+    
+    st.session_state.typed_responses.append({
+        'question_id': q.id,
+        'question': q.question,
+        'response': response,
+        'word_count': len(response.split())
+    })
+    
+    if not is_last:
+        st.session_state.q_index += 1
+        return
+    
+    # Get AI feedback for all typed answers in one go
+    if st.session_state.api_key:
+        responses = st.session_state.typed_responses
+        with st.spinner("Getting AI feedback..."):
+            feedback = get_ai_feedback_batch(responses, st.session_state.api_key)
+        for r, text in zip(responses, feedback):
+            r['ai_feedback'] = text
+    
+    st.session_state.phase = 'video_intro'
+    st.session_state.q_index = 0
 
 
 def show_video_intro():
@@ -462,12 +364,8 @@ def show_video_questions():
     q = questions[idx]
     
     # Question display (large, centered)
-    st.markdown(f"""
-    <div class="question-card question-card-video">
-        <span class="category-badge" style="background:#ef4444;">{q['category_name']}</span>
-        <h2 style="font-size: 1.6rem; margin-top: 15px;">{q['question']}</h2>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(render_html(VIDEO_QUESTION_CARD_HTML, category=q.category_name, question=q.question),
+                unsafe_allow_html=True)
     
     # Timer section
     st.markdown("---")
@@ -492,33 +390,22 @@ def show_video_questions():
                 st.session_state[f"timer_end_{idx}"] = time.time() + 60
                 st.rerun()
         else:
-            # Calculate remaining time
+            # The countdown ticks in the browser; reruns just resume it
             remaining = max(0, int(st.session_state[f"timer_end_{idx}"] - time.time()))
             
-            # Color based on time
-            if remaining > 30:
-                color_class = "timer-green"
-            elif remaining > 10:
-                color_class = "timer-yellow"
-            else:
-                color_class = "timer-red"
-            
-            st.markdown(f"""
-            <div class="timer-big {color_class}">
-                {remaining}
-            </div>
-            """, unsafe_allow_html=True)
-            
             if remaining > 0:
-                # Auto-refresh to update timer
-                time.sleep(1)
-                st.rerun()
+                st.components.v1.html(countdown_timer_component(remaining), height=260)
             else:
+                st.markdown("""
+                <div class="timer-big timer-red">
+                    0
+                </div>
+                """, unsafe_allow_html=True)
                 st.success("⏱️ Time's up! How did you go?")
     
     # Tips
     with st.expander("💡 Tips for this question"):
-        st.write(q.get('tips', 'Take a breath, then speak confidently!'))
+        st.write(q.tips or 'Take a breath, then speak confidently!')
     
     # Self-reflection
     st.markdown("### 📝 Self-Reflection")
@@ -534,8 +421,8 @@ def show_video_questions():
         btn_label = "Next Question →" if idx < len(questions) - 1 else "Finish Practice →"
         if st.button(btn_label, type="primary"):
             st.session_state.video_responses.append({
-                'question_id': q['id'],
-                'question': q['question'],
+                'question_id': q.id,
+                'question': q.question,
                 'notes': notes
             })
             
@@ -550,16 +437,12 @@ def show_completion():
     """Completion page with summary."""
     st.balloons()
     
-    st.markdown(f"""
-    <div class="success-banner">
-        <h1>🎉 Awesome Work, {st.session_state.student_name}!</h1>
-        <p>You've completed your practice interview!</p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(render_html(COMPLETION_BANNER_HTML, name=st.session_state.student_name),
+                unsafe_allow_html=True)
     
     # Save session
     try:
-        save_session(st.session_state.student_name, {
+        save_session_response(st.session_state.student_name, {
             'typed_responses': st.session_state.typed_responses,
             'video_responses': st.session_state.video_responses
         })
@@ -577,12 +460,8 @@ def show_completion():
                 st.info(resp['response'])
                 
                 if resp.get('ai_feedback'):
-                    st.markdown(f"""
-                    <div class="feedback-card">
-                        <strong>🤖 AI Feedback:</strong><br>
-                        {resp['ai_feedback']}
-                    </div>
-                    """, unsafe_allow_html=True)
+                    st.markdown(render_html(FEEDBACK_CARD_HTML, feedback=resp['ai_feedback']),
+                                unsafe_allow_html=True)
     
     with tab2:
         for i, resp in enumerate(st.session_state.video_responses, 1):
@@ -598,20 +477,15 @@ def show_completion():
     with col1:
         if st.button("🔄 Practice Again", type="primary"):
             # Keep name but reset session
-            name = st.session_state.student_name
-            api_key = st.session_state.get('api_key')
-            for key in list(st.session_state.keys()):
-                if key != 'app_mode':
-                    del st.session_state[key]
-            st.session_state.name_input = name
-            st.session_state.api_key_input = api_key or ""
+            reset_session(
+                name_input=st.session_state.student_name,
+                api_key_input=st.session_state.get('api_key') or ""
+            )
             st.rerun()
     
     with col2:
         if st.button("🏠 Start Over"):
-            for key in list(st.session_state.keys()):
-                if key != 'app_mode':
-                    del st.session_state[key]
+            reset_session()
             st.rerun()
     
     # Tips
@@ -640,60 +514,72 @@ def show_teacher_dashboard():
     </div>
     """, unsafe_allow_html=True)
     
-    sessions = load_all_sessions()
+    # Names and timestamps come from each session's saved data; the cache in
+    # load_session means files are only re-read when they change
+    sessions = [data for data in map(load_session, load_session_index()) if data]
     
     if not sessions:
         st.info("📭 No student sessions yet. They'll appear here after students complete practice.")
         return
     
-    # Stats
+    # Stats, gathered in a single pass
+    student_names = set()
+    total_responses = 0
+    for session in sessions:
+        student_names.add(session.get('student_name', 'Unknown'))
+        total_responses += len(session.get('typed_responses', ())) + len(session.get('video_responses', ()))
+    
     col1, col2, col3 = st.columns(3)
     with col1:
         st.metric("Total Sessions", len(sessions))
     with col2:
-        st.metric("Unique Students", len(set(s.get('student_name', '') for s in sessions)))
+        st.metric("Unique Students", len(student_names))
     with col3:
-        st.metric("Total Responses", 
-                 sum(len(s.get('typed_responses', [])) + len(s.get('video_responses', [])) for s in sessions))
+        st.metric("Total Responses", total_responses)
     
     st.divider()
     
     # Filter
-    students = ['All'] + list(set(s.get('student_name', 'Unknown') for s in sessions))
+    students = ['All'] + list(student_names)
     selected = st.selectbox("Filter by student:", students)
     
-    filtered = sessions if selected == 'All' else [s for s in sessions if s.get('student_name') == selected]
+    filtered = sessions if selected == 'All' else [s for s in sessions if s.get('student_name', 'Unknown') == selected]
     
     # Export
     st.download_button(
         "⬇️ Export to CSV",
-        export_to_csv(filtered),
+        export_sessions_to_csv(filtered),
         f"responses_{datetime.now().strftime('%Y%m%d')}.csv",
         "text/csv"
     )
     
     st.divider()
     
-    # Session list
-    for session in filtered:
-        student = session.get('student_name', 'Unknown')
-        timestamp = session.get('session_timestamp', '')[:16].replace('T', ' ')
-        typed_n = len(session.get('typed_responses', []))
-        video_n = len(session.get('video_responses', []))
+    # Session list, one page at a time
+    page_count = max(1, (len(filtered) + SESSIONS_PER_PAGE - 1) // SESSIONS_PER_PAGE)
+    page = st.number_input("Page", min_value=1, max_value=page_count, value=1, step=1)
+    st.caption(f"Page {page} of {page_count} ({len(filtered)} sessions)")
+    start = (page - 1) * SESSIONS_PER_PAGE
+    
+    for data in filtered[start:start + SESSIONS_PER_PAGE]:
+        student = data.get('student_name', 'Unknown')
+        timestamp = data.get('session_timestamp', '')[:16].replace('T', ' ')
+        typed_n = len(data.get('typed_responses', []))
+        video_n = len(data.get('video_responses', []))
         
         with st.expander(f"📋 {student} – {timestamp} ({typed_n} typed, {video_n} video)"):
-            if session.get('typed_responses'):
+            if data.get('typed_responses'):
                 st.markdown("**Typed Responses:**")
-                for r in session['typed_responses']:
+                for r in data['typed_responses']:
                     st.markdown(f"*Q: {r.get('question', '')}*")
                     st.info(r.get('response', ''))
                     if r.get('ai_feedback'):
                         st.caption(f"AI: {r['ai_feedback']}")
                     st.markdown("---")
             
-            if session.get('video_responses'):
+            if data.get('video_responses'):
                 st.markdown("**Video Practice Notes:**")
-                for r in session['video_responses']:
+                for r in data['video_responses']:
                     st.markdown(f"*Q: {r.get('question', '')}*")
                     st.caption(r.get('notes', 'No notes'))
 
@@ -722,9 +608,7 @@ def main():
         # Exit button
         if 'phase' in st.session_state and st.session_state.get('phase') not in ['welcome', None]:
             if st.button("⚠️ Exit Session"):
-                for key in list(st.session_state.keys()):
-                    if key != 'app_mode':
-                        del st.session_state[key]
+                reset_session()
                 st.rerun()
     
     # Route
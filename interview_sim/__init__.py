@@ -0,0 +1,6 @@
+"""
+Shared code for the Interview Practice Simulator apps.
+
+- core: question loading, session storage, CSV export and AI feedback
+- styles: the stylesheet every app injects
+"""
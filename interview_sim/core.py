@@ -0,0 +1,776 @@
+"""
+Question loading, session storage, CSV export and AI feedback shared by
+every version of the Interview Practice Simulator.
+"""
+
+import asyncio
+import base64
+import csv
+import hashlib
+import json
+import logging
+import os
+import queue
+import random
+import re
+import sqlite3
+import threading
+from collections import OrderedDict, namedtuple
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from contextlib import closing
+from datetime import datetime
+from io import StringIO
+from pathlib import Path
+
+import streamlit as st
+
+try:
+    import fcntl  # Not on Windows; the session log is then written unlocked
+except ImportError:
+    fcntl = None
+
+try:
+    import orjson  # Optional: faster JSON encode/decode
+except ImportError:
+    orjson = None
+
+# ============================================================
+# CONFIGURATION
+# ============================================================
+
+QUESTIONS_FILE = "questions.json"
+RESPONSES_DIR = "responses"
+VIDEOS_DIR = "responses/videos"
+# Derived copy of every session file, read by load_all_sessions. The
+# per-session JSON files are the source of truth: after deleting or editing
+# one, delete this log too and it is rebuilt from the files on the next save
+# (until then load_all_sessions reads the files directly).
+SESSION_LOG = "responses/sessions.jsonl"
+FEEDBACK_DB = "responses/feedback_cache.sqlite"
+FEEDBACK_MODEL = "claude-sonnet-4-20250514"
+
+# Question 'type' values eligible for each phase
+TYPED_TYPES = frozenset({'typed', 'both'})
+VIDEO_TYPES = frozenset({'video', 'both'})
+
+# Fallback bank used when the questions file is missing
+DEFAULT_QUESTIONS = (
+    {"id": "A1", "category": "A", "category_name": "Personal & Motivation",
+     "question": "Tell us about yourself and what interests you about working in retail.",
+     "type": "both", "tips": "Keep it professional. Mention your interests and why retail appeals to you."},
+    {"id": "B1", "category": "B", "category_name": "Customer Service",
+     "question": "What does excellent customer service mean to you?",
+     "type": "both", "tips": "Think about making customers feel valued and solving their problems."},
+)
+
+# Create directories
+Path(RESPONSES_DIR).mkdir(exist_ok=True)
+Path(VIDEOS_DIR).mkdir(exist_ok=True)
+
+logger = logging.getLogger(__name__)
+
+# ============================================================
+# QUESTIONS
+# ============================================================
+
+def questions_mtime():
+    """Return the questions file's modification time in ns, or None if it's missing.
+
+    Nanoseconds rather than float seconds, so two saves within the same
+    coarse tick still produce different cache keys.
+    """
+    try:
+        return os.stat(QUESTIONS_FILE).st_mtime_ns
+    except OSError:
+        return None
+
+
+# One bank entry; fields missing from the file (e.g. tips) are None
+Question = namedtuple('Question', 'id category category_name question type tips difficulty')
+
+
+def _group_by_category(questions):
+    """Map category -> list of questions, in bank order."""
+    groups = {}
+    for q in questions:
+        groups.setdefault(q.category, []).append(q)
+    return groups
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def load_questions(mtime=None):
+    """Load questions from JSON file, split into typed and video pools.
+
+    Each question becomes a ``Question`` namedtuple. Returns ``{'all',
+    'typed', 'video'}`` lists plus ``'typed_by_cat'`` and ``'video_by_cat'``
+    (category -> list), so session setup doesn't re-filter or re-group the
+    whole bank. Cached across reruns and sessions; ``mtime`` only feeds the
+    cache key, so pass ``questions_mtime()`` to pick up edits to the file.
+    The ttl lets entries for superseded mtimes expire.
+    """
+    try:
+        with open(QUESTIONS_FILE, 'rb') as f:
+            raw = loads_json(f.read())['questions']
+    except FileNotFoundError:
+        st.error(f"❌ Questions file not found: {QUESTIONS_FILE}")
+        raw = DEFAULT_QUESTIONS
+
+    questions = [Question._make(map(q.get, Question._fields)) for q in raw]
+    typed = [q for q in questions if q.type in TYPED_TYPES]
+    video = [q for q in questions if q.type in VIDEO_TYPES]
+    return {
+        'all': questions,
+        'typed': typed,
+        'video': video,
+        'typed_by_cat': _group_by_category(typed),
+        'video_by_cat': _group_by_category(video)
+    }
+
+
+# Private generator for question selection, separate from the global one
+_rng = random.Random()
+
+
+def _sample_without_replacement(seq, k, rng):
+    """Pick ``k`` distinct items of ``seq`` (Floyd's algorithm, O(k)).
+
+    Returned in index order, so shuffle the result if order matters.
+    """
+    n = len(seq)
+    picked = set()
+    for j in range(n - k, n):
+        i = rng.randrange(j + 1)
+        picked.add(j if i in picked else i)
+    return [seq[i] for i in sorted(picked)]
+
+
+def _sample_by_category(by_cat, quotas, used_ids):
+    """Pick up to ``quotas[category]`` questions per category, skipping ``used_ids``."""
+    selected = []
+    for category, quota in quotas.items():
+        candidates = by_cat.get(category, ())
+        if used_ids:
+            candidates = [q for q in candidates if q.id not in used_ids]
+        selected.extend(_sample_without_replacement(candidates, min(quota, len(candidates)), _rng))
+    return selected
+
+
+def select_session_questions(pools, typed_count=5, video_count=5):
+    """Randomly select questions for a practice session, honouring category quotas."""
+    typed_quotas = {'A': 2, 'B': 1, 'C': 1, 'D': 1}
+    video_quotas = {'A': 1, 'B': 2, 'C': 1, 'D': 1}
+
+    selected_typed = _sample_by_category(pools['typed_by_cat'], typed_quotas, ())
+    used_ids = {q.id for q in selected_typed}
+    selected_video = _sample_by_category(pools['video_by_cat'], video_quotas, used_ids)
+
+    # Samples come out grouped by category; mix each phase's order
+    _rng.shuffle(selected_typed)
+    _rng.shuffle(selected_video)
+
+    return {
+        'typed': selected_typed[:typed_count],
+        'video': selected_video[:video_count]
+    }
+
+# ============================================================
+# SESSION STORAGE
+# ============================================================
+
+def dumps_json(data):
+    """Serialise to indented JSON bytes, using orjson when it's installed."""
+    if orjson:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode('utf-8')
+
+
+def dumps_json_line(data):
+    """Serialise to a single line of JSON bytes, newline included."""
+    if orjson:
+        return orjson.dumps(data) + b"\n"
+    return json.dumps(data).encode('utf-8') + b"\n"
+
+
+def loads_json(raw):
+    """Parse JSON bytes, using orjson when it's installed."""
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+
+# Runs of anything but letters, digits, '_' and '-' become one underscore
+SAFE_NAME_RE = re.compile(r'[^\w-]+')
+
+
+def _resolve_video_files(video_responses):
+    """Wait for any background ``save_video_file`` writes and store their filenames."""
+    return [
+        {**resp, 'video_file': resp['video_file'].result()}
+        if isinstance(resp.get('video_file'), Future) else resp
+        for resp in video_responses
+    ]
+
+
+# Directories whose entries changed (a rename) and still need an fsync.
+# Bounded, so a stalled disk pushes back on savers instead of growing.
+_dir_sync_queue = queue.Queue(maxsize=64)
+
+
+def _sync_dirs_forever():
+    """Background worker: fsync each queued directory once per batch."""
+    while True:
+        dirs = {_dir_sync_queue.get()}
+        while True:
+            try:
+                dirs.add(_dir_sync_queue.get_nowait())
+            except queue.Empty:
+                break
+        for path in dirs:
+            try:
+                fd = os.open(path, os.O_RDONLY)
+                try:
+                    os.fsync(fd)
+                finally:
+                    os.close(fd)
+            except OSError:
+                pass  # Directories can't be opened/fsynced on Windows
+
+
+threading.Thread(target=_sync_dirs_forever, name="dir-sync", daemon=True).start()
+
+
+def save_session_response(student_name, session_data):
+    """Save the student's responses to a JSON file."""
+    # One clock read, so the filename and session_timestamp always agree
+    now = datetime.now()
+    timestamp = now.strftime("%Y%m%d_%H%M%S")
+    safe_name = SAFE_NAME_RE.sub('_', student_name).strip('_')
+    filename = f"{RESPONSES_DIR}/{timestamp}_{safe_name}.json"
+
+    save_data = {
+        'student_name': student_name,
+        'session_id': f"{timestamp}_{safe_name}",
+        'session_timestamp': now.isoformat(),
+        'typed_responses': session_data.get('typed_responses', []),
+        'video_responses': _resolve_video_files(session_data.get('video_responses', [])),
+        'ai_feedback': session_data.get('ai_feedback', [])
+    }
+
+    # Write to a temp file first so a crash never leaves half a session
+    # behind; the data is fsynced before the rename, and the rename itself
+    # is made durable by the batched directory fsync
+    tmp = filename + ".tmp"
+    with open(tmp, 'wb') as f:
+        f.write(dumps_json(save_data))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, filename)
+    _dir_sync_queue.put(RESPONSES_DIR)
+
+    try:
+        _append_session_log(save_data)
+    except OSError as e:
+        # The session file is saved; drop the log so it's rebuilt from the
+        # files on the next save instead of silently missing this session
+        logger.warning("Could not append to %s, discarding it: %s", SESSION_LOG, e)
+        try:
+            os.remove(SESSION_LOG)
+        except OSError:
+            pass
+    return filename
+
+
+def _append_session_log(save_data):
+    """Append a saved session to the JSONL log read by ``load_all_sessions``.
+
+    The first write seeds the log from the per-session files already on
+    disk (including the one just saved) so older sessions aren't lost. If
+    an earlier write was cut short, the torn line is terminated first so
+    it doesn't swallow this session too.
+    """
+    with open(SESSION_LOG, 'a+b') as f:
+        if fcntl:
+            fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            if os.fstat(f.fileno()).st_size == 0:
+                sessions = [data for data in map(load_session, load_session_index()) if data]
+                f.write(b"".join(dumps_json_line(data) for data in reversed(sessions)))
+            else:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    f.write(b"\n")
+                f.write(dumps_json_line(save_data))
+        finally:
+            if fcntl:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+
+# (dir_mtime_ns, sessions) for the last scan of RESPONSES_DIR
+_session_index_cache = None
+
+
+def load_session_index():
+    """List saved session files, newest first, for ``load_session``.
+
+    Only the timestamp used for ordering is taken from the
+    ``{timestamp}_{name}.json`` filenames written by
+    ``save_session_response``; the name part is sanitised, so callers load
+    each entry with ``load_session`` for the student name and responses.
+    That cache only re-reads files whose mtime changed. The directory is
+    only rescanned when its mtime changes, which every save does since
+    sessions land via ``os.replace``.
+    """
+    global _session_index_cache
+    try:
+        dir_mtime = os.stat(RESPONSES_DIR).st_mtime_ns
+    except FileNotFoundError:
+        return []
+    if _session_index_cache and _session_index_cache[0] == dir_mtime:
+        return list(_session_index_cache[1])
+
+    sessions = []
+    with os.scandir(RESPONSES_DIR) as entries:
+        for entry in entries:
+            if not (entry.name.endswith('.json') and entry.is_file()):
+                continue
+            stat = entry.stat()
+            if stat.st_size < 2:  # Empty or truncated, nothing to show
+                continue
+            parts = entry.name.split('_', 2)
+            try:
+                timestamp = datetime.strptime(parts[0] + parts[1][:6], "%Y%m%d%H%M%S").isoformat()
+            except (IndexError, ValueError):
+                timestamp = ''
+            sessions.append({
+                'filename': entry.name,
+                'session_timestamp': timestamp,
+                'mtime': stat.st_mtime_ns,
+            })
+    sessions.sort(key=lambda x: x['session_timestamp'], reverse=True)
+
+    _session_index_cache = (dir_mtime, sessions)
+    return list(sessions)
+
+
+def _read_session(filename):
+    """Parse one session file, or return {} if it can't be read."""
+    try:
+        with open(os.path.join(RESPONSES_DIR, filename), 'rb') as f:
+            data = loads_json(f.read())
+    except (ValueError, OSError) as e:  # JSONDecodeError is a ValueError
+        logger.warning("Skipping unreadable session file %s: %s", filename, e)
+        return {}
+    data['filename'] = filename
+    return data
+
+
+# Parsed sessions: filename -> (mtime_ns, data). Shared by every browser
+# session in the process; callers must treat the dicts as read-only.
+_session_cache = {}
+
+
+def load_session(entry):
+    """Load the full responses for a ``load_session_index`` entry.
+
+    Only re-reads the file when its mtime has changed since the last load.
+    """
+    cached = _session_cache.get(entry['filename'])
+    if cached is not None and cached[0] == entry['mtime']:
+        return cached[1]
+    data = _read_session(entry['filename'])
+    _session_cache[entry['filename']] = (entry['mtime'], data)
+    return data
+
+
+# (mtime_ns, size, sessions) for the last read of SESSION_LOG
+_session_log_cache = None
+
+
+def load_all_sessions():
+    """Load every saved session for teacher review, newest first.
+
+    One sequential read of the JSONL log, redone only when the log changes.
+    A session saved more than once (e.g. re-saved on a rerun) is logged
+    more than once; its last line wins. Falls back to the per-session files
+    (the source of truth, see SESSION_LOG) if nothing has been logged yet.
+    """
+    global _session_log_cache
+    try:
+        stat = os.stat(SESSION_LOG)
+    except FileNotFoundError:
+        return [data for data in map(load_session, load_session_index()) if data]
+
+    if _session_log_cache and _session_log_cache[:2] == (stat.st_mtime_ns, stat.st_size):
+        return list(_session_log_cache[2])
+
+    by_id = {}
+    with open(SESSION_LOG, 'rb') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                data = loads_json(line)
+            except ValueError as e:  # e.g. a line cut short by a crash
+                logger.warning("Skipping unreadable line in %s: %s", SESSION_LOG, e)
+                continue
+            # Sessions from the old cloud app have no session_id
+            key = data.get('session_id') or (data.get('student_name'), data.get('session_timestamp'))
+            by_id[key] = data
+    sessions = list(by_id.values())
+    sessions.sort(key=lambda x: x.get('session_timestamp', ''), reverse=True)
+
+    _session_log_cache = (stat.st_mtime_ns, stat.st_size, sessions)
+    return list(sessions)
+
+
+# Background writer for recordings, so decoding and disk I/O don't hold up
+# the script run that received the upload
+_io_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="video-writer")
+
+
+def _write_video(video_data, session_id, question_id):
+    """Write one recording (decoding it if base64); returns the filename or None on failure."""
+    try:
+        if isinstance(video_data, str):
+            # Drop any "data:video/webm;base64," prefix; find() returns -1 when
+            # there isn't one, so the slice then keeps the whole payload
+            video_data = base64.b64decode(video_data[video_data.find(',') + 1:])
+        filename = f"{VIDEOS_DIR}/{session_id}_{question_id}.webm"
+        with open(filename, 'wb', buffering=1 << 20) as f:
+            f.write(video_data)
+        return filename
+    except Exception:
+        return None
+
+
+def save_video_file(video_data, session_id, question_id):
+    """Save a recording to file in the background.
+
+    ``video_data`` is raw bytes or a base64 string (optionally a data:
+    URL). Nothing calls this yet: the apps render their recorders with
+    st.components.v1.html, which can't return a value to Python.
+
+    Returns a Future resolving to the filename (or None on failure). Store it
+    as a video response's ``video_file``; ``save_session_response`` waits for
+    it when the session is saved.
+    """
+    return _io_pool.submit(_write_video, video_data, session_id, question_id)
+
+# ============================================================
+# AI FEEDBACK
+# ============================================================
+
+# One event loop for all feedback requests, running on a daemon thread.
+# AsyncAnthropic clients are bound to the loop they first ran on, so a
+# long-lived loop is what lets _client_cache keep their connections open.
+_feedback_loop = None
+_feedback_loop_lock = threading.Lock()
+
+# AsyncAnthropic clients, least recently used first, keyed by a hash of
+# the API key so raw keys aren't held here; only touched from _feedback_loop
+_client_cache = OrderedDict()
+_CLIENT_CACHE_SIZE = 32
+
+
+def _submit_feedback(coro):
+    """Schedule ``coro`` on the shared feedback loop; returns a concurrent Future."""
+    global _feedback_loop
+    with _feedback_loop_lock:
+        if _feedback_loop is None:
+            _feedback_loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=_feedback_loop.run_forever, name="feedback-loop", daemon=True
+            ).start()
+    return asyncio.run_coroutine_threadsafe(coro, _feedback_loop)
+
+
+def _run_feedback(coro):
+    """Run ``coro`` on the shared feedback loop and wait for its result."""
+    return _submit_feedback(coro).result()
+
+
+def _import_anthropic():
+    """Return the optional anthropic SDK, or None if it isn't installed.
+
+    Imported on first use rather than at module top, so the teacher
+    dashboard and sessions without AI feedback never load it.
+    """
+    try:
+        import anthropic
+    except ImportError:
+        return None
+    return anthropic
+
+
+def _client(api_key):
+    """Return the cached AsyncAnthropic client for ``api_key``.
+
+    Must be called on ``_feedback_loop``. Evicted clients are closed there.
+    """
+    key = hashlib.blake2b(api_key.encode(), digest_size=16).hexdigest()
+    client = _client_cache.get(key)
+    if client is None:
+        client = _client_cache[key] = _import_anthropic().AsyncAnthropic(api_key=api_key)
+        if len(_client_cache) > _CLIENT_CACHE_SIZE:
+            _, evicted = _client_cache.popitem(last=False)
+            _feedback_loop.create_task(evicted.close())
+    else:
+        _client_cache.move_to_end(key)
+    return client
+
+
+@st.cache_resource(ttl=86400)
+def _feedback_cache():
+    """AI feedback shared by all sessions, keyed by ``_feedback_key``."""
+    return {}
+
+
+def _feedback_key(question_id, response):
+    """Cache key for a response; case and whitespace edits map to the same key."""
+    normalised = " ".join(response.lower().split())
+    digest = hashlib.blake2b(normalised.encode(), digest_size=16).hexdigest()
+    return (question_id, digest, FEEDBACK_MODEL)
+
+
+# The coaching rubric is the same for every answer, so it goes in the system
+# prompt; only the question and answer vary
+FEEDBACK_SYSTEM = """You are a helpful interview coach providing feedback to a secondary school student
+practicing for a retail job interview at Woolworths Australia.
+
+Please provide brief, encouraging feedback (3-4 sentences) that:
+1. Highlights one thing they did well
+2. Suggests one specific improvement
+3. Gives a concrete tip for their next attempt
+
+Keep your tone friendly and supportive - remember they're a student, likely nervous about their first job interview.
+"""
+
+
+async def _feedback(client, question, response):
+    """Request feedback on one response from the async Anthropic client."""
+    prompt = f"""The student was asked: "{question}"
+
+Their response was: "{response}"
+"""
+
+    message = await client.messages.create(
+        model=FEEDBACK_MODEL,
+        max_tokens=300,
+        system=FEEDBACK_SYSTEM,
+        messages=[
+            {"role": "user", "content": prompt}
+        ]
+    )
+    return message.content[0].text
+
+
+NO_SDK_FEEDBACK = "⚠️ AI feedback requires the 'anthropic' package. Install with: pip install anthropic"
+
+
+def _stored_feedback(keys):
+    """Look up feedback saved to FEEDBACK_DB by this or an earlier process.
+
+    A missing, locked or read-only database just means no hits; the
+    in-memory cache and the API still work without it.
+    """
+    ids = ["|".join(key) for key in keys]
+    try:
+        with closing(sqlite3.connect(FEEDBACK_DB)) as db:
+            db.execute("CREATE TABLE IF NOT EXISTS feedback (key TEXT PRIMARY KEY, feedback TEXT)")
+            rows = db.execute(
+                f"SELECT key, feedback FROM feedback WHERE key IN ({','.join('?' * len(ids))})", ids
+            ).fetchall()
+    except sqlite3.Error as e:
+        logger.warning("Could not read %s: %s", FEEDBACK_DB, e)
+        return {}
+    found = dict(rows)
+    return {key: found[id_] for key, id_ in zip(keys, ids) if id_ in found}
+
+
+def _store_feedback(results):
+    """Persist new ``{key: feedback}`` results to FEEDBACK_DB, if it's writable."""
+    try:
+        with closing(sqlite3.connect(FEEDBACK_DB)) as db, db:
+            db.execute("CREATE TABLE IF NOT EXISTS feedback (key TEXT PRIMARY KEY, feedback TEXT)")
+            db.executemany(
+                "INSERT OR REPLACE INTO feedback (key, feedback) VALUES (?, ?)",
+                [("|".join(key), text) for key, text in results.items()]
+            )
+    except sqlite3.Error as e:
+        logger.warning("Could not write %s: %s", FEEDBACK_DB, e)
+
+
+def get_ai_feedback_batch(responses, api_key):
+    """Get AI feedback for a list of typed response dicts.
+
+    Answers already seen for the same question are served from the shared
+    in-memory cache, then from FEEDBACK_DB (which survives restarts); the
+    rest are sent concurrently, so the wait is roughly one API round-trip
+    rather than one per question.
+    """
+    cache = _feedback_cache()
+    keys = [_feedback_key(r['question_id'], r['response']) for r in responses]
+    pending = [(k, r) for k, r in zip(keys, responses) if k not in cache]
+
+    if pending:
+        cache.update(_stored_feedback([k for k, _ in pending]))
+        pending = [(k, r) for k, r in pending if k not in cache]
+
+    if pending:
+        if _import_anthropic() is None:
+            return [NO_SDK_FEEDBACK] * len(responses)
+
+        async def gather():
+            client = _client(api_key)
+            return await asyncio.gather(
+                *(_feedback(client, r['question'], r['response']) for _, r in pending),
+                return_exceptions=True
+            )
+
+        errors = {}
+        fresh = {}
+        for (key, _), result in zip(pending, _run_feedback(gather())):
+            if isinstance(result, Exception):
+                errors[key] = f"⚠️ Could not generate AI feedback: {str(result)}"
+            else:
+                fresh[key] = result
+        if fresh:
+            cache.update(fresh)
+            _store_feedback(fresh)
+        return [cache[k] if k in cache else errors[k] for k in keys]
+
+    return [cache[k] for k in keys]
+
+
+def get_ai_feedback(question, response, api_key):
+    """Get AI feedback on one response to ``question`` (a ``Question``)."""
+    return get_ai_feedback_batch(
+        [{'question_id': question.id, 'question': question.question, 'response': response}],
+        api_key
+    )[0]
+
+
+def prefetch_ai_feedback(question, response, api_key):
+    """Start feedback on one answer without waiting for it; returns a Future.
+
+    Cached answers resolve straight away. Others run as a task on the
+    shared feedback loop, alongside every other student's requests, so no
+    thread sits blocked on the API. The Future resolves to None if the
+    anthropic package isn't installed.
+    """
+    key = _feedback_key(question.id, response)
+    cache = _feedback_cache()
+    if key not in cache:
+        cache.update(_stored_feedback([key]))
+    if key in cache or _import_anthropic() is None:
+        future = Future()
+        future.set_result(cache.get(key))
+        return future
+
+    async def fetch():
+        return await _feedback(_client(api_key), question.question, response)
+
+    return _submit_feedback(fetch())
+
+
+def collect_ai_feedback(responses, futures, timeout=30):
+    """Store each prefetched result as its response's ``ai_feedback``.
+
+    Waits up to ``timeout`` seconds in total. Requests still running then
+    are cancelled rather than sent again, so no answer is billed twice.
+    """
+    done, _ = wait(futures, timeout=timeout)
+    cache = _feedback_cache()
+    fresh = {}
+    for resp, future in zip(responses, futures):
+        if future not in done:
+            future.cancel()
+            resp['ai_feedback'] = "⚠️ AI feedback timed out. Try again next session."
+        elif future.exception() is not None:
+            resp['ai_feedback'] = f"⚠️ Could not generate AI feedback: {future.exception()}"
+        elif future.result() is None:
+            resp['ai_feedback'] = NO_SDK_FEEDBACK
+        else:
+            resp['ai_feedback'] = future.result()
+            key = _feedback_key(resp['question_id'], resp['response'])
+            if key not in cache:
+                fresh[key] = future.result()
+    if fresh:
+        cache.update(fresh)
+        _store_feedback(fresh)
+
+# ============================================================
+# CSV EXPORT
+# ============================================================
+
+def _has_ai_feedback(sessions):
+    """True if any typed response in ``sessions`` has AI feedback."""
+    return any(
+        resp.get('ai_feedback')
+        for session in sessions
+        for resp in session.get('typed_responses', [])
+    )
+
+
+def iter_csv_chunks(sessions, include_feedback=True):
+    """Yield the CSV export as UTF-8 bytes, one chunk per session.
+
+    Each session's rows go through a single ``writerows`` call into a small
+    reused buffer, so memory stays flat no matter how many sessions are
+    exported and the download needs no separate encode step. With
+    ``include_feedback=False`` the AI Feedback column is left out.
+    """
+    buffer = StringIO()
+    writer = csv.writer(buffer)
+
+    def flush():
+        chunk = buffer.getvalue().encode('utf-8')
+        buffer.seek(0)
+        buffer.truncate(0)
+        return chunk
+
+    header = ['Student Name', 'Session Date', 'Question Type', 'Question ID',
+              'Question', 'Response']
+    if include_feedback:
+        header.append('AI Feedback')
+    writer.writerow(header)
+    yield flush()
+
+    for session in sessions:
+        student = session.get('student_name', 'Unknown')
+        timestamp = session.get('session_timestamp', '')[:10]
+        typed = session.get('typed_responses', [])
+        # Video responses: the student's self-reflection notes are the response
+        video = session.get('video_responses', [])
+
+        if include_feedback:
+            writer.writerows(
+                (student, timestamp, 'Typed', resp.get('question_id', ''),
+                 resp.get('question', ''), resp.get('response', ''),
+                 resp.get('ai_feedback', ''))
+                for resp in typed
+            )
+            writer.writerows(
+                (student, timestamp, 'Video', resp.get('question_id', ''),
+                 resp.get('question', ''), resp.get('notes', ''), '')
+                for resp in video
+            )
+        else:
+            writer.writerows(
+                (student, timestamp, 'Typed', resp.get('question_id', ''),
+                 resp.get('question', ''), resp.get('response', ''))
+                for resp in typed
+            )
+            writer.writerows(
+                (student, timestamp, 'Video', resp.get('question_id', ''),
+                 resp.get('question', ''), resp.get('notes', ''))
+                for resp in video
+            )
+        yield flush()
+
+
+def export_sessions_to_csv(sessions):
+    """Export sessions to CSV format, as UTF-8 bytes.
+
+    The AI Feedback column is only included if some response has feedback.
+    """
+    sessions = list(sessions)
+    return b"".join(iter_csv_chunks(sessions, _has_ai_feedback(sessions)))
@@ -0,0 +1,37 @@
+"""
+Shared stylesheet and sidebar logo for the Interview Practice Simulator apps.
+"""
+
+from pathlib import Path
+
+import streamlit as st
+
+STYLES_FILE = Path(__file__).with_name("styles.css")
+
+# Drop a copy of the logo here to serve it locally instead of from Wikimedia
+LOGO_FILE = Path(__file__).with_name("assets") / "woolworths_logo.png"
+LOGO_URL = "https://upload.wikimedia.org/wikipedia/en/thumb/f/f5/Woolworths_logo.svg/200px-Woolworths_logo.svg.png"
+
+
+@st.cache_data(show_spinner=False)
+def load_css():
+    """Read the shared stylesheet once per process."""
+    return STYLES_FILE.read_text()
+
+
+def inject_css():
+    """Add the stylesheet to the page.
+
+    Call on every run (after ``st.set_page_config``): Streamlit drops
+    elements a rerun doesn't produce.
+    """
+    st.markdown(f"<style>{load_css()}</style>", unsafe_allow_html=True)
+
+
+@st.cache_resource(show_spinner=False)
+def logo():
+    """Sidebar logo for ``st.image``: the bundled PNG's bytes, else LOGO_URL."""
+    try:
+        return LOGO_FILE.read_bytes()
+    except FileNotFoundError:
+        return LOGO_URL
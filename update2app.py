@@ -12,26 +12,18 @@ To run: streamlit run app.py
 """
 
 import streamlit as st
-import json
-import random
-import os
-import base64
-import csv
 from datetime import datetime
-from pathlib import Path
-from io import StringIO
 
-# ============================================================
-# CONFIGURATION
-# ============================================================
-
-QUESTIONS_FILE = "questions.json"
-RESPONSES_DIR = "responses"
-VIDEOS_DIR = "responses/videos"
-
-# Create directories
-Path(RESPONSES_DIR).mkdir(exist_ok=True)
-Path(VIDEOS_DIR).mkdir(exist_ok=True)
+from interview_sim.core import (
+    questions_mtime,
+    load_questions,
+    select_session_questions,
+    save_session_response,
+    load_all_sessions,
+    get_ai_feedback,
+    export_sessions_to_csv,
+)
+from interview_sim.styles import inject_css, logo
 
 # ============================================================
 # PAGE CONFIG
@@ -48,285 +40,7 @@ st.set_page_config(
 # CUSTOM CSS
 # ============================================================
 
-st.markdown("""
-<style>
-    /* Main styling */
-    .main-header {
-        background: linear-gradient(135deg, #1e3a5f 0%, #2d5a87 100%);
-        padding: 2rem;
-        border-radius: 15px;
-        color: white;
-        margin-bottom: 2rem;
-        text-align: center;
-    }
-    
-    .question-card {
-        background: linear-gradient(145deg, #f8fafc 0%, #e2e8f0 100%);
-        padding: 2rem;
-        border-radius: 15px;
-        border-left: 5px solid #3b82f6;
-        margin: 1.5rem 0;
-        box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
-    }
-    
-    .question-card-video {
-        background: linear-gradient(145deg, #fef3f2 0%, #fee2e2 100%);
-        border-left: 5px solid #ef4444;
-    }
-    
-    .category-badge {
-        background: #3b82f6;
-        color: white;
-        padding: 0.3rem 0.8rem;
-        border-radius: 20px;
-        font-size: 0.8rem;
-        display: inline-block;
-        margin-bottom: 0.5rem;
-    }
-    
-    .timer-display {
-        font-size: 4rem;
-        font-weight: bold;
-        text-align: center;
-        color: #ef4444;
-        font-family: 'Courier New', monospace;
-        padding: 1rem;
-        background: #1a1a2e;
-        border-radius: 10px;
-        margin: 1rem 0;
-    }
-    
-    .success-card {
-        background: linear-gradient(145deg, #ecfdf5 0%, #d1fae5 100%);
-        padding: 2rem;
-        border-radius: 15px;
-        border-left: 5px solid #10b981;
-        margin: 1rem 0;
-    }
-    
-    .feedback-card {
-        background: linear-gradient(145deg, #fffbeb 0%, #fef3c7 100%);
-        padding: 1.5rem;
-        border-radius: 10px;
-        border-left: 4px solid #f59e0b;
-        margin: 1rem 0;
-    }
-    
-    .stats-card {
-        background: white;
-        padding: 1.5rem;
-        border-radius: 10px;
-        box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        text-align: center;
-    }
-    
-    .recording-indicator {
-        display: inline-block;
-        width: 12px;
-        height: 12px;
-        background: #ef4444;
-        border-radius: 50%;
-        margin-right: 8px;
-        animation: pulse 1s infinite;
-    }
-    
-    @keyframes pulse {
-        0%, 100% { opacity: 1; }
-        50% { opacity: 0.5; }
-    }
-    
-    /* Hide Streamlit branding */
-    #MainMenu {visibility: hidden;}
-    footer {visibility: hidden;}
-</style>
-""", unsafe_allow_html=True)
-
-# ============================================================
-# HELPER FUNCTIONS
-# ============================================================
-
-def load_questions():
-    """Load questions from JSON file."""
-    try:
-        with open(QUESTIONS_FILE, 'r') as f:
-            data = json.load(f)
-            return data['questions']
-    except FileNotFoundError:
-        st.error(f"❌ Questions file not found: {QUESTIONS_FILE}")
-        return []
-
-
-def select_session_questions(all_questions, typed_count=5, video_count=5):
-    """Randomly select questions for a practice session."""
-    typed_eligible = [q for q in all_questions if q['type'] in ['typed', 'both']]
-    video_eligible = [q for q in all_questions if q['type'] in ['video', 'both']]
-    
-    def group_by_category(questions):
-        groups = {}
-        for q in questions:
-            cat = q['category']
-            if cat not in groups:
-                groups[cat] = []
-            groups[cat].append(q)
-        return groups
-    
-    typed_by_cat = group_by_category(typed_eligible)
-    video_by_cat = group_by_category(video_eligible)
-    
-    typed_quotas = {'A': 2, 'B': 1, 'C': 1, 'D': 1}
-    video_quotas = {'A': 1, 'B': 2, 'C': 1, 'D': 1}
-    
-    selected_typed = []
-    selected_video = []
-    used_ids = set()
-    
-    for category, quota in typed_quotas.items():
-        if category in typed_by_cat:
-            available = [q for q in typed_by_cat[category] if q['id'] not in used_ids]
-            chosen = random.sample(available, min(quota, len(available)))
-            selected_typed.extend(chosen)
-            used_ids.update(q['id'] for q in chosen)
-    
-    for category, quota in video_quotas.items():
-        if category in video_by_cat:
-            available = [q for q in video_by_cat[category] if q['id'] not in used_ids]
-            chosen = random.sample(available, min(quota, len(available)))
-            selected_video.extend(chosen)
-            used_ids.update(q['id'] for q in chosen)
-    
-    random.shuffle(selected_typed)
-    random.shuffle(selected_video)
-    
-    return {
-        'typed': selected_typed[:typed_count],
-        'video': selected_video[:video_count]
-    }
-
-
-def save_session_response(student_name, session_data):
-    """Save the student's responses to a JSON file."""
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    safe_name = "".join(c for c in student_name if c.isalnum() or c in (' ', '-', '_')).strip()
-    safe_name = safe_name.replace(' ', '_')
-    filename = f"{RESPONSES_DIR}/{timestamp}_{safe_name}.json"
-    
-    save_data = {
-        'student_name': student_name,
-        'session_id': f"{timestamp}_{safe_name}",
-        'session_timestamp': datetime.now().isoformat(),
-        'typed_responses': session_data.get('typed_responses', []),
-        'video_responses': session_data.get('video_responses', []),
-        'ai_feedback': session_data.get('ai_feedback', [])
-    }
-    
-    with open(filename, 'w') as f:
-        json.dump(save_data, f, indent=2)
-    
-    return filename
-
-
-def load_all_sessions():
-    """Load all saved session files for teacher review."""
-    sessions = []
-    if os.path.exists(RESPONSES_DIR):
-        for filename in os.listdir(RESPONSES_DIR):
-            if filename.endswith('.json'):
-                filepath = os.path.join(RESPONSES_DIR, filename)
-                try:
-                    with open(filepath, 'r') as f:
-                        data = json.load(f)
-                        data['filename'] = filename
-                        sessions.append(data)
-                except:
-                    pass
-    # Sort by timestamp, newest first
-    sessions.sort(key=lambda x: x.get('session_timestamp', ''), reverse=True)
-    return sessions
-
-
-def save_video_file(video_data_b64, session_id, question_id):
-    """Save base64 encoded video to file."""
-    try:
-        video_data = base64.b64decode(video_data_b64.split(',')[1] if ',' in video_data_b64 else video_data_b64)
-        filename = f"{VIDEOS_DIR}/{session_id}_{question_id}.webm"
-        with open(filename, 'wb') as f:
-            f.write(video_data)
-        return filename
-    except Exception as e:
-        return None
-
-
-def get_ai_feedback(question, response, api_key):
-    """Get AI feedback on a response using Claude API."""
-    try:
-        import anthropic
-        
-        client = anthropic.Anthropic(api_key=api_key)
-        
-        prompt = f"""You are a helpful interview coach providing feedback to a secondary school student 
-practicing for a retail job interview at Woolworths Australia.
-
-The student was asked: "{question}"
-
-Their response was: "{response}"
-
-Please provide brief, encouraging feedback (3-4 sentences) that:
-1. Highlights one thing they did well
-2. Suggests one specific improvement
-3. Gives a concrete tip for their next attempt
-
-Keep your tone friendly and supportive - remember they're a student, likely nervous about their first job interview.
-"""
-        
-        message = client.messages.create(
-            model="claude-sonnet-4-20250514",
-            max_tokens=300,
-            messages=[
-                {"role": "user", "content": prompt}
-            ]
-        )
-        
-        return message.content[0].text
-    
-    except ImportError:
-        return "⚠️ AI feedback requires the 'anthropic' package. Install with: pip install anthropic"
-    except Exception as e:
-        return f"⚠️ Could not generate AI feedback: {str(e)}"
-
-
-def export_sessions_to_csv(sessions):
-    """Export sessions to CSV format."""
-    output = StringIO()
-    writer = csv.writer(output)
-    
-    # Header
-    writer.writerow([
-        'Student Name', 'Session Date', 'Question Type', 'Question ID',
-        'Question', 'Response', 'AI Feedback'
-    ])
-    
-    for session in sessions:
-        student = session.get('student_name', 'Unknown')
-        timestamp = session.get('session_timestamp', '')[:10]
-        
-        # Typed responses
-        for resp in session.get('typed_responses', []):
-            writer.writerow([
-                student, timestamp, 'Typed', resp.get('question_id', ''),
-                resp.get('question', ''), resp.get('response', ''),
-                resp.get('ai_feedback', '')
-            ])
-        
-        # Video responses
-        for resp in session.get('video_responses', []):
-            writer.writerow([
-                student, timestamp, 'Video', resp.get('question_id', ''),
-                resp.get('question', ''), '[Video Recording]',
-                resp.get('notes', '')
-            ])
-    
-    return output.getvalue()
-
+inject_css()
 
 # ============================================================
 # VIDEO RECORDING COMPONENT
@@ -706,8 +420,7 @@ def show_student_welcome():
         st.session_state.session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
         
         # Select random questions
-        all_questions = load_questions()
-        st.session_state.session_questions = select_session_questions(all_questions)
+        st.session_state.session_questions = select_session_questions(load_questions(questions_mtime()))
         
         st.rerun()
 
@@ -729,14 +442,14 @@ def show_typed_questions():
         # Question card
         st.markdown(f"""
         <div class="question-card">
-            <span class="category-badge">{question['category_name']}</span>
-            <h3 style="margin-top: 10px;">{question['question']}</h3>
+            <span class="category-badge">{question.category_name}</span>
+            <h3 style="margin-top: 10px;">{question.question}</h3>
         </div>
         """, unsafe_allow_html=True)
         
         # Tips
         with st.expander("💡 Tips for this question"):
-            st.write(question.get('tips', 'Take your time and be authentic!'))
+            st.write(question.tips or 'Take your time and be authentic!')
         
         # Response area
         response = st.text_area(
@@ -780,8 +493,8 @@ def show_typed_questions():
         if finish_clicked and response.strip():
             # Save response
             response_data = {
-                'question_id': question['id'],
-                'question': question['question'],
+                'question_id': question.id,
+                'question': question.question,
                 'response': response,
                 'word_count': word_count,
                 'timestamp': datetime.now().isoformat()
@@ -791,7 +504,7 @@ def show_typed_questions():
             if st.session_state.api_key:
                 with st.spinner("Getting AI feedback..."):
                     feedback = get_ai_feedback(
-                        question['question'],
+                        question,
                         response,
                         st.session_state.api_key
                     )
@@ -869,20 +582,20 @@ def show_video_questions():
         # Question card (larger for video)
         st.markdown(f"""
         <div class="question-card question-card-video">
-            <span class="category-badge" style="background: #ef4444;">{question['category_name']}</span>
-            <h2 style="margin-top: 15px; font-size: 1.5rem;">{question['question']}</h2>
+            <span class="category-badge" style="background: #ef4444;">{question.category_name}</span>
+            <h2 style="margin-top: 15px; font-size: 1.5rem;">{question.question}</h2>
         </div>
         """, unsafe_allow_html=True)
         
         # Tips
         with st.expander("💡 Tips for this question"):
-            st.write(question.get('tips', 'Take a breath, then start speaking confidently!'))
+            st.write(question.tips or 'Take a breath, then start speaking confidently!')
         
         # Video recorder
         st.markdown("### Your Recording")
         
         # Use iframe for video component (simpler approach)
-        video_html = video_recorder_component(question['question'], time_limit=60)
+        video_html = video_recorder_component(question.question, time_limit=60)
         st.components.v1.html(video_html, height=900, scrolling=True)
         
         # Self-assessment notes
@@ -903,8 +616,8 @@ def show_video_questions():
             if current_idx < len(questions) - 1:
                 if st.button("Next Question →", type="primary"):
                     st.session_state.video_responses.append({
-                        'question_id': question['id'],
-                        'question': question['question'],
+                        'question_id': question.id,
+                        'question': question.question,
                         'notes': notes,
                         'timestamp': datetime.now().isoformat()
                     })
@@ -913,8 +626,8 @@ def show_video_questions():
             else:
                 if st.button("Complete Practice Session →", type="primary"):
                     st.session_state.video_responses.append({
-                        'question_id': question['id'],
-                        'question': question['question'],
+                        'question_id': question.id,
+                        'question': question.question,
                         'notes': notes,
                         'timestamp': datetime.now().isoformat()
                     })
@@ -1123,7 +836,7 @@ def main():
     
     # Sidebar navigation
     with st.sidebar:
-        st.image("https://upload.wikimedia.org/wikipedia/en/thumb/f/f5/Woolworths_logo.svg/200px-Woolworths_logo.svg.png", width=150)
+        st.image(logo(), width=150)
         st.markdown("---")
         
         mode = st.radio(
@@ -12,26 +12,21 @@ To run: streamlit run app.py
 """
 
 import streamlit as st
-import json
-import random
-import os
-import base64
-import csv
 from datetime import datetime
-from pathlib import Path
-from io import StringIO
-
-# ============================================================
-# CONFIGURATION
-# ============================================================
-
-QUESTIONS_FILE = "questions.json"
-RESPONSES_DIR = "responses"
-VIDEOS_DIR = "responses/videos"
-
-# Create directories
-Path(RESPONSES_DIR).mkdir(exist_ok=True)
-Path(VIDEOS_DIR).mkdir(exist_ok=True)
+from functools import lru_cache
+from types import MappingProxyType
+
+from interview_sim.core import (
+    questions_mtime,
+    load_questions,
+    select_session_questions,
+    save_session_response,
+    load_all_sessions,
+    prefetch_ai_feedback,
+    collect_ai_feedback,
+    export_sessions_to_csv,
+)
+from interview_sim.styles import inject_css, logo
 
 # ============================================================
 # PAGE CONFIG
@@ -48,285 +43,7 @@ st.set_page_config(
 # CUSTOM CSS
 # ============================================================
 
-st.markdown("""
-<style>
-    /* Main styling */
-    .main-header {
-        background: linear-gradient(135deg, #1e3a5f 0%, #2d5a87 100%);
-        padding: 2rem;
-        border-radius: 15px;
-        color: white;
-        margin-bottom: 2rem;
-        text-align: center;
-    }
-    
-    .question-card {
-        background: linear-gradient(145deg, #f8fafc 0%, #e2e8f0 100%);
-        padding: 2rem;
-        border-radius: 15px;
-        border-left: 5px solid #3b82f6;
-        margin: 1.5rem 0;
-        box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
-    }
-    
-    .question-card-video {
-        background: linear-gradient(145deg, #fef3f2 0%, #fee2e2 100%);
-        border-left: 5px solid #ef4444;
-    }
-    
-    .category-badge {
-        background: #3b82f6;
-        color: white;
-        padding: 0.3rem 0.8rem;
-        border-radius: 20px;
-        font-size: 0.8rem;
-        display: inline-block;
-        margin-bottom: 0.5rem;
-    }
-    
-    .timer-display {
-        font-size: 4rem;
-        font-weight: bold;
-        text-align: center;
-        color: #ef4444;
-        font-family: 'Courier New', monospace;
-        padding: 1rem;
-        background: #1a1a2e;
-        border-radius: 10px;
-        margin: 1rem 0;
-    }
-    
-    .success-card {
-        background: linear-gradient(145deg, #ecfdf5 0%, #d1fae5 100%);
-        padding: 2rem;
-        border-radius: 15px;
-        border-left: 5px solid #10b981;
-        margin: 1rem 0;
-    }
-    
-    .feedback-card {
-        background: linear-gradient(145deg, #fffbeb 0%, #fef3c7 100%);
-        padding: 1.5rem;
-        border-radius: 10px;
-        border-left: 4px solid #f59e0b;
-        margin: 1rem 0;
-    }
-    
-    .stats-card {
-        background: white;
-        padding: 1.5rem;
-        border-radius: 10px;
-        box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        text-align: center;
-    }
-    
-    .recording-indicator {
-        display: inline-block;
-        width: 12px;
-        height: 12px;
-        background: #ef4444;
-        border-radius: 50%;
-        margin-right: 8px;
-        animation: pulse 1s infinite;
-    }
-    
-    @keyframes pulse {
-        0%, 100% { opacity: 1; }
-        50% { opacity: 0.5; }
-    }
-    
-    /* Hide Streamlit branding */
-    #MainMenu {visibility: hidden;}
-    footer {visibility: hidden;}
-</style>
-""", unsafe_allow_html=True)
-
-# ============================================================
-# HELPER FUNCTIONS
-# ============================================================
-
-def load_questions():
-    """Load questions from JSON file."""
-    try:
-        with open(QUESTIONS_FILE, 'r') as f:
-            data = json.load(f)
-            return data['questions']
-    except FileNotFoundError:
-        st.error(f"❌ Questions file not found: {QUESTIONS_FILE}")
-        return []
-
-
-def select_session_questions(all_questions, typed_count=5, video_count=5):
-    """Randomly select questions for a practice session."""
-    typed_eligible = [q for q in all_questions if q['type'] in ['typed', 'both']]
-    video_eligible = [q for q in all_questions if q['type'] in ['video', 'both']]
-    
-    def group_by_category(questions):
-        groups = {}
-        for q in questions:
-            cat = q['category']
-            if cat not in groups:
-                groups[cat] = []
-            groups[cat].append(q)
-        return groups
-    
-    typed_by_cat = group_by_category(typed_eligible)
-    video_by_cat = group_by_category(video_eligible)
-    
-    typed_quotas = {'A': 2, 'B': 1, 'C': 1, 'D': 1}
-    video_quotas = {'A': 1, 'B': 2, 'C': 1, 'D': 1}
-    
-    selected_typed = []
-    selected_video = []
-    used_ids = set()
-    
-    for category, quota in typed_quotas.items():
-        if category in typed_by_cat:
-            available = [q for q in typed_by_cat[category] if q['id'] not in used_ids]
-            chosen = random.sample(available, min(quota, len(available)))
-            selected_typed.extend(chosen)
-            used_ids.update(q['id'] for q in chosen)
-    
-    for category, quota in video_quotas.items():
-        if category in video_by_cat:
-            available = [q for q in video_by_cat[category] if q['id'] not in used_ids]
-            chosen = random.sample(available, min(quota, len(available)))
-            selected_video.extend(chosen)
-            used_ids.update(q['id'] for q in chosen)
-    
-    random.shuffle(selected_typed)
-    random.shuffle(selected_video)
-    
-    return {
-        'typed': selected_typed[:typed_count],
-        'video': selected_video[:video_count]
-    }
-
-
-def save_session_response(student_name, session_data):
-    """Save the student's responses to a JSON file."""
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    safe_name = "".join(c for c in student_name if c.isalnum() or c in (' ', '-', '_')).strip()
-    safe_name = safe_name.replace(' ', '_')
-    filename = f"{RESPONSES_DIR}/{timestamp}_{safe_name}.json"
-    
-    save_data = {
-        'student_name': student_name,
-        'session_id': f"{timestamp}_{safe_name}",
-        'session_timestamp': datetime.now().isoformat(),
-        'typed_responses': session_data.get('typed_responses', []),
-        'video_responses': session_data.get('video_responses', []),
-        'ai_feedback': session_data.get('ai_feedback', [])
-    }
-    
-    with open(filename, 'w') as f:
-        json.dump(save_data, f, indent=2)
-    
-    return filename
-
-
-def load_all_sessions():
-    """Load all saved session files for teacher review."""
-    sessions = []
-    if os.path.exists(RESPONSES_DIR):
-        for filename in os.listdir(RESPONSES_DIR):
-            if filename.endswith('.json'):
-                filepath = os.path.join(RESPONSES_DIR, filename)
-                try:
-                    with open(filepath, 'r') as f:
-                        data = json.load(f)
-                        data['filename'] = filename
-                        sessions.append(data)
-                except:
-                    pass
-    # Sort by timestamp, newest first
-    sessions.sort(key=lambda x: x.get('session_timestamp', ''), reverse=True)
-    return sessions
-
-
-def save_video_file(video_data_b64, session_id, question_id):
-    """Save base64 encoded video to file."""
-    try:
-        video_data = base64.b64decode(video_data_b64.split(',')[1] if ',' in video_data_b64 else video_data_b64)
-        filename = f"{VIDEOS_DIR}/{session_id}_{question_id}.webm"
-        with open(filename, 'wb') as f:
-            f.write(video_data)
-        return filename
-    except Exception as e:
-        return None
-
-
-def get_ai_feedback(question, response, api_key):
-    """Get AI feedback on a response using Claude API."""
-    try:
-        import anthropic
-        
-        client = anthropic.Anthropic(api_key=api_key)
-        
-        prompt = f"""You are a helpful interview coach providing feedback to a secondary school student 
-practicing for a retail job interview at Woolworths Australia.
-
-The student was asked: "{question}"
-
-Their response was: "{response}"
-
-Please provide brief, encouraging feedback (3-4 sentences) that:
-1. Highlights one thing they did well
-2. Suggests one specific improvement
-3. Gives a concrete tip for their next attempt
-
-Keep your tone friendly and supportive - remember they're a student, likely nervous about their first job interview.
-"""
-        
-        message = client.messages.create(
-            model="claude-sonnet-4-20250514",
-            max_tokens=300,
-            messages=[
-                {"role": "user", "content": prompt}
-            ]
-        )
-        
-        return message.content[0].text
-    
-    except ImportError:
-        return "⚠️ AI feedback requires the 'anthropic' package. Install with: pip install anthropic"
-    except Exception as e:
-        return f"⚠️ Could not generate AI feedback: {str(e)}"
-
-
-def export_sessions_to_csv(sessions):
-    """Export sessions to CSV format."""
-    output = StringIO()
-    writer = csv.writer(output)
-    
-    # Header
-    writer.writerow([
-        'Student Name', 'Session Date', 'Question Type', 'Question ID',
-        'Question', 'Response', 'AI Feedback'
-    ])
-    
-    for session in sessions:
-        student = session.get('student_name', 'Unknown')
-        timestamp = session.get('session_timestamp', '')[:10]
-        
-        # Typed responses
-        for resp in session.get('typed_responses', []):
-            writer.writerow([
-                student, timestamp, 'Typed', resp.get('question_id', ''),
-                resp.get('question', ''), resp.get('response', ''),
-                resp.get('ai_feedback', '')
-            ])
-        
-        # Video responses
-        for resp in session.get('video_responses', []):
-            writer.writerow([
-                student, timestamp, 'Video', resp.get('question_id', ''),
-                resp.get('question', ''), '[Video Recording]',
-                resp.get('notes', '')
-            ])
-    
-    return output.getvalue()
-
+inject_css()
 
 # ============================================================
 # VIDEO RECORDING COMPONENT
@@ -622,50 +339,133 @@ def video_recorder_component(question_text, time_limit=60):
     return component_html
 
 
+# ============================================================
+# STATIC PAGE CONTENT
+# ============================================================
+# Built once at import so page functions don't rebuild them every rerun.
+
+WELCOME_HEADER_HTML = """
+<div class="main-header">
+    <h1>🎯 Interview Practice Simulator</h1>
+    <p>Master your Woolworths interview with realistic practice</p>
+</div>
+"""
+
+WELCOME_OVERVIEW_MD = """
+### What to Expect
+
+**Phase 1: Typed Questions** (5 questions)
+- Type your responses in the text boxes
+- Take your time to think before answering
+- Aim for 3-5 sentences per answer
+
+**Phase 2: Video Questions** (5 questions)  
+- Record yourself answering using your webcam
+- You have 60 seconds per question
+- You can re-record if you're not happy
+
+**Phase 3: AI Feedback** (Optional)
+- Get instant feedback on your typed responses
+- Learn what you did well and how to improve
+"""
+
+QUICK_STATS_HTML = """
+<div class="stats-card">
+    <h3>📊 Quick Stats</h3>
+    <p><strong>10</strong> Questions Total</p>
+    <p><strong>60 sec</strong> Per Video</p>
+    <p><strong>~20 min</strong> Session Time</p>
+</div>
+"""
+
+VIDEO_INTRO_HTML = """
+<div class="main-header">
+    <h1>🎬 Phase 2: Video Questions</h1>
+    <p>Record yourself answering interview questions</p>
+</div>
+"""
+
+VIDEO_HOW_IT_WORKS_MD = """
+### How It Works
+
+1. **Allow camera access** when prompted
+2. **Read the question** displayed on screen
+3. **Click "Start Recording"** when ready
+4. **Speak your answer** within 60 seconds
+5. **Review and submit** or re-record
+"""
+
+VIDEO_TIPS_MD = """
+### Tips for Video Interviews
+
+- 📷 Look at the camera, not the screen
+- 🗣️ Speak clearly and at a moderate pace
+- 😊 Smile naturally
+- 💡 Good lighting helps!
+- 🎯 Use the full 60 seconds if needed
+"""
+
+STAR_METHOD_MD = """
+---
+### 💪 Keep Improving!
+
+**The STAR Method** for behavioural questions:
+- **S**ituation: Set the scene
+- **T**ask: What was your responsibility?
+- **A**ction: What did you do?
+- **R**esult: What was the outcome?
+"""
+
+TEACHER_HEADER_HTML = """
+<div class="main-header">
+    <h1>👩‍🏫 Teacher Dashboard</h1>
+    <p>Review and export student practice sessions</p>
+</div>
+"""
+
+
+@lru_cache(maxsize=128)
+def completion_header_html(student_name):
+    """Completion banner for ``student_name``."""
+    return f"""
+<div class="main-header">
+    <h1>🎉 Excellent Work, {student_name}!</h1>
+    <p>You've completed your practice interview session</p>
+</div>
+"""
+
+
 # ============================================================
 # PAGE: STUDENT PRACTICE
 # ============================================================
 
+_NOW = datetime.now
+
+
+def _record(question, response=None, notes=None):
+    """Response record for ``question``: a typed ``response`` or video ``notes``."""
+    record = {'question_id': question.id, 'question': question.question}
+    if response is not None:
+        record['response'] = response
+        record['word_count'] = len(response.split())
+    if notes is not None:
+        record['notes'] = notes
+    record['timestamp'] = _NOW().isoformat()
+    return record
+
+
 def show_student_welcome():
     """Display the welcome/start screen for students."""
     
-    st.markdown("""
-    <div class="main-header">
-        <h1>🎯 Interview Practice Simulator</h1>
-        <p>Master your Woolworths interview with realistic practice</p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(WELCOME_HEADER_HTML, unsafe_allow_html=True)
     
     col1, col2 = st.columns([2, 1])
     
     with col1:
-        st.markdown("""
-        ### What to Expect
-        
-        **Phase 1: Typed Questions** (5 questions)
-        - Type your responses in the text boxes
-        - Take your time to think before answering
-        - Aim for 3-5 sentences per answer
-        
-        **Phase 2: Video Questions** (5 questions)  
-        - Record yourself answering using your webcam
-        - You have 60 seconds per question
-        - You can re-record if you're not happy
-        
-        **Phase 3: AI Feedback** (Optional)
-        - Get instant feedback on your typed responses
-        - Learn what you did well and how to improve
-        """)
+        st.markdown(WELCOME_OVERVIEW_MD)
     
     with col2:
-        st.markdown("""
-        <div class="stats-card">
-            <h3>📊 Quick Stats</h3>
-            <p><strong>10</strong> Questions Total</p>
-            <p><strong>60 sec</strong> Per Video</p>
-            <p><strong>~20 min</strong> Session Time</p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(QUICK_STATS_HTML, unsafe_allow_html=True)
     
     st.divider()
     
@@ -701,13 +501,13 @@ def show_student_welcome():
         st.session_state.typed_responses = []
         st.session_state.video_responses = []
         st.session_state.ai_feedback = []
+        st.session_state.ai_futures = []
         
         # Generate session ID
         st.session_state.session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
         
         # Select random questions
-        all_questions = load_questions()
-        st.session_state.session_questions = select_session_questions(all_questions)
+        st.session_state.session_questions = select_session_questions(load_questions(questions_mtime()))
         
         st.rerun()
 
@@ -729,114 +529,69 @@ def show_typed_questions():
         # Question card
         st.markdown(f"""
         <div class="question-card">
-            <span class="category-badge">{question['category_name']}</span>
-            <h3 style="margin-top: 10px;">{question['question']}</h3>
+            <span class="category-badge">{question.category_name}</span>
+            <h3 style="margin-top: 10px;">{question.question}</h3>
         </div>
         """, unsafe_allow_html=True)
         
         # Tips
         with st.expander("💡 Tips for this question"):
-            st.write(question.get('tips', 'Take your time and be authentic!'))
-        
-        # Response area
-        response = st.text_area(
-            "Your response:",
-            height=200,
-            key=f"typed_response_{current_idx}",
-            placeholder="Type your answer here... Aim for 3-5 sentences."
-        )
-        
-        # Word count
-        word_count = len(response.split()) if response else 0
-        st.caption(f"Word count: {word_count}")
-        
-        # Navigation
-        col1, col2, col3 = st.columns([1, 1, 1])
-        
-        with col3:
-            if current_idx < len(questions) - 1:
-                if st.button("Next Question →", type="primary", disabled=not response.strip()):
-                    # Save response
-                    response_data = {
-                        'question_id': question['id'],
-                        'question': question['question'],
-                        'response': response,
-                        'word_count': word_count,
-                        'timestamp': datetime.now().isoformat()
-                    }
-                    
-                    # Get AI feedback if enabled
-                    if st.session_state.api_key:
-                        with st.spinner("Getting AI feedback..."):
-                            feedback = get_ai_feedback(
-                                question['question'],
-                                response,
-                                st.session_state.api_key
-                            )
-                            response_data['ai_feedback'] = feedback
-                    
-                    st.session_state.typed_responses.append(response_data)
-                    st.session_state.current_question += 1
-                    st.rerun()
+            st.write(question.tips or 'Take your time and be authentic!')
+        
+        # Response form: typing doesn't rerun the script, only submitting does
+        is_last = current_idx == len(questions) - 1
+        with st.form(f"typed_form_{current_idx}", clear_on_submit=True):
+            response = st.text_area(
+                "Your response:",
+                height=200,
+                key=f"typed_response_{current_idx}",
+                placeholder="Type your answer here... Aim for 3-5 sentences."
+            )
+            
+            # Navigation
+            col1, col2, col3 = st.columns([1, 1, 1])
+            with col3:
+                submitted = st.form_submit_button(
+                    "Continue to Video Questions →" if is_last else "Next Question →",
+                    type="primary"
+                )
+        
+        if submitted:
+            if not response.strip():
+                st.warning("Please type a response before continuing.")
+                return
+            
+            # Save response
+            response_data = _record(question, response=response)
+            
+            # Start AI feedback in the background; it's collected on the
+            # completion screen, by which time it's usually ready
+            if st.session_state.api_key:
+                st.session_state.ai_futures.append(
+                    prefetch_ai_feedback(question, response, st.session_state.api_key)
+                )
+            
+            st.session_state.typed_responses.append(response_data)
+            if is_last:
+                st.session_state.phase = 'video_intro'
+                st.session_state.current_question = 0
             else:
-                if st.button("Continue to Video Questions →", type="primary", disabled=not response.strip()):
-                    # Save final typed response
-                    response_data = {
-                        'question_id': question['id'],
-                        'question': question['question'],
-                        'response': response,
-                        'word_count': word_count,
-                        'timestamp': datetime.now().isoformat()
-                    }
-                    
-                    if st.session_state.api_key:
-                        with st.spinner("Getting AI feedback..."):
-                            feedback = get_ai_feedback(
-                                question['question'],
-                                response,
-                                st.session_state.api_key
-                            )
-                            response_data['ai_feedback'] = feedback
-                    
-                    st.session_state.typed_responses.append(response_data)
-                    st.session_state.phase = 'video_intro'
-                    st.session_state.current_question = 0
-                    st.rerun()
+                st.session_state.current_question += 1
+            st.rerun()
 
 
 def show_video_intro():
     """Show introduction before video questions."""
     
-    st.markdown("""
-    <div class="main-header">
-        <h1>🎬 Phase 2: Video Questions</h1>
-        <p>Record yourself answering interview questions</p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(VIDEO_INTRO_HTML, unsafe_allow_html=True)
     
     col1, col2 = st.columns(2)
     
     with col1:
-        st.markdown("""
-        ### How It Works
-        
-        1. **Allow camera access** when prompted
-        2. **Read the question** displayed on screen
-        3. **Click "Start Recording"** when ready
-        4. **Speak your answer** within 60 seconds
-        5. **Review and submit** or re-record
-        """)
+        st.markdown(VIDEO_HOW_IT_WORKS_MD)
     
     with col2:
-        st.markdown("""
-        ### Tips for Video Interviews
-        
-        - 📷 Look at the camera, not the screen
-        - 🗣️ Speak clearly and at a moderate pace
-        - 😊 Smile naturally
-        - 💡 Good lighting helps!
-        - 🎯 Use the full 60 seconds if needed
-        """)
+        st.markdown(VIDEO_TIPS_MD)
     
     st.divider()
     
@@ -866,57 +621,51 @@ def show_video_questions():
         # Question card (larger for video)
         st.markdown(f"""
         <div class="question-card question-card-video">
-            <span class="category-badge" style="background: #ef4444;">{question['category_name']}</span>
-            <h2 style="margin-top: 15px; font-size: 1.5rem;">{question['question']}</h2>
+            <span class="category-badge" style="background: #ef4444;">{question.category_name}</span>
+            <h2 style="margin-top: 15px; font-size: 1.5rem;">{question.question}</h2>
         </div>
         """, unsafe_allow_html=True)
         
         # Tips
         with st.expander("💡 Tips for this question"):
-            st.write(question.get('tips', 'Take a breath, then start speaking confidently!'))
+            st.write(question.tips or 'Take a breath, then start speaking confidently!')
         
         # Video recorder
         st.markdown("### Your Recording")
         
         # Use iframe for video component (simpler approach)
-        video_html = video_recorder_component(question['question'], time_limit=60)
+        video_html = video_recorder_component(question.question, time_limit=60)
         st.components.v1.html(video_html, height=900, scrolling=True)
         
-        # Self-assessment notes
+        # Self-assessment notes, in a form so typing doesn't rerun the page
+        # (and reload the recorder iframe)
         st.markdown("### 📝 Self-Reflection (Optional)")
-        notes = st.text_area(
-            "How did that go? What would you improve?",
-            height=100,
-            key=f"video_notes_{current_idx}",
-            placeholder="Jot down any thoughts about your response..."
-        )
-        
-        st.divider()
-        
-        # Navigation
-        col1, col2, col3 = st.columns([1, 1, 1])
-        
-        with col3:
-            if current_idx < len(questions) - 1:
-                if st.button("Next Question →", type="primary"):
-                    st.session_state.video_responses.append({
-                        'question_id': question['id'],
-                        'question': question['question'],
-                        'notes': notes,
-                        'timestamp': datetime.now().isoformat()
-                    })
-                    st.session_state.current_question += 1
-                    st.rerun()
+        is_last = current_idx == len(questions) - 1
+        with st.form(f"video_form_{current_idx}", clear_on_submit=True):
+            notes = st.text_area(
+                "How did that go? What would you improve?",
+                height=100,
+                key=f"video_notes_{current_idx}",
+                placeholder="Jot down any thoughts about your response..."
+            )
+            
+            st.divider()
+            
+            # Navigation
+            col1, col2, col3 = st.columns([1, 1, 1])
+            with col3:
+                submitted = st.form_submit_button(
+                    "Complete Practice Session →" if is_last else "Next Question →",
+                    type="primary"
+                )
+        
+        if submitted:
+            st.session_state.video_responses.append(_record(question, notes=notes))
+            if is_last:
+                st.session_state.phase = 'complete'
             else:
-                if st.button("Complete Practice Session →", type="primary"):
-                    st.session_state.video_responses.append({
-                        'question_id': question['id'],
-                        'question': question['question'],
-                        'notes': notes,
-                        'timestamp': datetime.now().isoformat()
-                    })
-                    st.session_state.phase = 'complete'
-                    st.rerun()
+                st.session_state.current_question += 1
+            st.rerun()
 
 
 def show_completion():
@@ -924,12 +673,19 @@ def show_completion():
     
     st.balloons()
     
-    st.markdown(f"""
-    <div class="main-header">
-        <h1>🎉 Excellent Work, {st.session_state.student_name}!</h1>
-        <p>You've completed your practice interview session</p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(completion_header_html(st.session_state.student_name), unsafe_allow_html=True)
+    
+    # Collect the AI feedback prefetched during the typed phase. Clear the
+    # futures first so a failure can't repeat on every rerun, and never let
+    # it stop the session being saved below.
+    futures = st.session_state.get('ai_futures')
+    if futures:
+        st.session_state.ai_futures = []
+        try:
+            with st.spinner("Getting AI feedback..."):
+                collect_ai_feedback(st.session_state.typed_responses, futures)
+        except Exception as e:
+            st.warning(f"Could not get AI feedback: {e}")
     
     # Save session
     try:
@@ -985,44 +741,55 @@ def show_completion():
     with col1:
         if st.button("🔄 Practice Again", type="primary"):
             name = st.session_state.student_name
-            api_key = st.session_state.api_key
-            for key in list(st.session_state.keys()):
-                del st.session_state[key]
+            st.session_state.clear()
             st.session_state.student_name_input = name
             st.rerun()
     
     with col2:
         if st.button("🏠 Return to Start"):
-            for key in list(st.session_state.keys()):
-                del st.session_state[key]
+            st.session_state.clear()
             st.rerun()
     
     # STAR method reminder
-    st.markdown("""
-    ---
-    ### 💪 Keep Improving!
-    
-    **The STAR Method** for behavioural questions:
-    - **S**ituation: Set the scene
-    - **T**ask: What was your responsibility?
-    - **A**ction: What did you do?
-    - **R**esult: What was the outcome?
-    """)
+    st.markdown(STAR_METHOD_MD)
 
 
 # ============================================================
 # PAGE: TEACHER DASHBOARD
 # ============================================================
 
+@st.cache_data(show_spinner=False)
+def session_stats(_sessions, key):
+    """Return ``(student_names, total_typed, total_video)`` in one pass.
+
+    Names are deduplicated in first-seen order (a dict keeps insertion
+    order), so the most recently active students come first.
+    ``_sessions`` isn't hashed (leading underscore); ``key`` stands in for
+    it, so pass something that changes whenever the sessions do.
+    """
+    names = {}
+    total_typed = total_video = 0
+    for s in _sessions:
+        names[s.get('student_name', 'Unknown')] = None
+        total_typed += len(s.get('typed_responses', ()))
+        total_video += len(s.get('video_responses', ()))
+    return tuple(names), total_typed, total_video
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def sessions_csv(_sessions, key):
+    """CSV export of ``_sessions``, cached on ``key``.
+
+    Key on each session's student name and timestamp: sessions saved by
+    the old cloud app have no ``session_id``.
+    """
+    return export_sessions_to_csv(_sessions)
+
+
 def show_teacher_dashboard():
     """Display the teacher review dashboard."""
     
-    st.markdown("""
-    <div class="main-header">
-        <h1>👩‍🏫 Teacher Dashboard</h1>
-        <p>Review and export student practice sessions</p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(TEACHER_HEADER_HTML, unsafe_allow_html=True)
     
     # Load all sessions
     sessions = load_all_sessions()
@@ -1034,14 +801,15 @@ def show_teacher_dashboard():
     # Stats overview
     col1, col2, col3, col4 = st.columns(4)
     
-    unique_students = len(set(s.get('student_name', '') for s in sessions))
-    total_typed = sum(len(s.get('typed_responses', [])) for s in sessions)
-    total_video = sum(len(s.get('video_responses', [])) for s in sessions)
+    # Sessions come newest first, so the count plus the newest timestamp
+    # changes whenever a session is added
+    sessions_version = (len(sessions), sessions[0].get('session_timestamp'))
+    names, total_typed, total_video = session_stats(sessions, sessions_version)
     
     with col1:
         st.metric("Total Sessions", len(sessions))
     with col2:
-        st.metric("Unique Students", unique_students)
+        st.metric("Unique Students", len(names))
     with col3:
         st.metric("Typed Responses", total_typed)
     with col4:
@@ -1053,8 +821,7 @@ def show_teacher_dashboard():
     col1, col2 = st.columns(2)
     
     with col1:
-        student_names = ['All Students'] + list(set(s.get('student_name', 'Unknown') for s in sessions))
-        selected_student = st.selectbox("Filter by Student:", student_names)
+        selected_student = st.selectbox("Filter by Student:", ('All Students',) + names)
     
     with col2:
         sort_option = st.selectbox("Sort by:", ['Newest First', 'Oldest First', 'Student Name'])
@@ -1069,58 +836,96 @@ def show_teacher_dashboard():
     elif sort_option == 'Student Name':
         filtered_sessions.sort(key=lambda x: x.get('student_name', ''))
     
-    # Export button
+    # Export button; the CSV is only built once the teacher asks for it, and
+    # only for the filter/sort it was asked for (changing either resets it)
     st.markdown("### 📥 Export Data")
-    csv_data = export_sessions_to_csv(filtered_sessions)
-    st.download_button(
-        label="⬇️ Download as CSV",
-        data=csv_data,
-        file_name=f"interview_responses_{datetime.now().strftime('%Y%m%d')}.csv",
-        mime="text/csv"
-    )
+    view = (selected_student, sort_option)
+    if st.button("📦 Prepare CSV Export"):
+        st.session_state.csv_requested = view
+    
+    if st.session_state.get('csv_requested') == view:
+        st.download_button(
+            label="⬇️ Download as CSV",
+            data=sessions_csv(
+                filtered_sessions,
+                tuple((s.get('student_name'), s.get('session_timestamp')) for s in filtered_sessions)
+            ),
+            file_name=f"interview_responses_{datetime.now().strftime('%Y%m%d')}.csv",
+            mime="text/csv"
+        )
     
     st.divider()
     
-    # Session list
+    # Session list: one summary table; only the selected session is rendered
     st.markdown("### 📋 Session Details")
     
-    for session in filtered_sessions:
-        student = session.get('student_name', 'Unknown')
-        timestamp = session.get('session_timestamp', '')[:16].replace('T', ' ')
-        typed_count = len(session.get('typed_responses', []))
-        video_count = len(session.get('video_responses', []))
-        
-        with st.expander(f"📌 {student} - {timestamp} ({typed_count} typed, {video_count} video)"):
-            # Typed responses
-            if session.get('typed_responses'):
-                st.markdown("#### 📝 Typed Responses")
-                for resp in session['typed_responses']:
-                    st.markdown(f"**Q: {resp.get('question', 'N/A')}**")
-                    st.info(resp.get('response', 'No response'))
-                    if resp.get('ai_feedback'):
-                        st.markdown(f"**AI Feedback:** {resp['ai_feedback']}")
-                    st.markdown("---")
-            
-            # Video responses
-            if session.get('video_responses'):
-                st.markdown("#### 🎬 Video Responses")
-                for resp in session['video_responses']:
-                    st.markdown(f"**Q: {resp.get('question', 'N/A')}**")
-                    if resp.get('notes'):
-                        st.caption(f"Student notes: {resp['notes']}")
-                    st.markdown("---")
+    table = st.dataframe(
+        [
+            {
+                'Student': session.get('student_name', 'Unknown'),
+                'Date': session.get('session_timestamp', '')[:16].replace('T', ' '),
+                'Typed': len(session.get('typed_responses', [])),
+                'Video': len(session.get('video_responses', []))
+            }
+            for session in filtered_sessions
+        ],
+        hide_index=True,
+        use_container_width=True,
+        on_select="rerun",
+        selection_mode="single-row",
+        # New key whenever the rows can shift (filter, sort or a newly saved
+        # session), so a stale row selection doesn't open the wrong session
+        key=f"session_table_{selected_student}_{sort_option}_{sessions_version}"
+    )
+    
+    if not table.selection.rows:
+        st.caption("Select a session in the table to see its responses.")
+        return
+    
+    session = filtered_sessions[table.selection.rows[0]]
+    st.markdown(f"#### 📌 {session.get('student_name', 'Unknown')} - "
+                f"{session.get('session_timestamp', '')[:16].replace('T', ' ')}")
+    
+    # Typed responses
+    if session.get('typed_responses'):
+        st.markdown("#### 📝 Typed Responses")
+        for resp in session['typed_responses']:
+            st.markdown(f"**Q: {resp.get('question', 'N/A')}**")
+            st.info(resp.get('response', 'No response'))
+            if resp.get('ai_feedback'):
+                st.markdown(f"**AI Feedback:** {resp['ai_feedback']}")
+            st.markdown("---")
+    
+    # Video responses
+    if session.get('video_responses'):
+        st.markdown("#### 🎬 Video Responses")
+        for resp in session['video_responses']:
+            st.markdown(f"**Q: {resp.get('question', 'N/A')}**")
+            if resp.get('notes'):
+                st.caption(f"Student notes: {resp['notes']}")
+            st.markdown("---")
 
 
 # ============================================================
 # MAIN APPLICATION
 # ============================================================
 
+# Student practice page for each session phase
+_PHASE_HANDLERS = MappingProxyType({
+    'welcome': show_student_welcome,
+    'typed': show_typed_questions,
+    'video_intro': show_video_intro,
+    'video': show_video_questions,
+    'complete': show_completion,
+})
+
+
 def main():
     """Main application entry point."""
     
     # Sidebar navigation
     with st.sidebar:
-        st.image("https://upload.wikimedia.org/wikipedia/en/thumb/f/f5/Woolworths_logo.svg/200px-Woolworths_logo.svg.png", width=150)
+        st.image(logo(), width=150)
         st.markdown("---")
         
         mode = st.radio(
@@ -1145,9 +950,9 @@ def main():
         if 'phase' in st.session_state and st.session_state.phase not in ['welcome', None]:
             st.markdown("---")
             if st.button("⚠️ Exit Session"):
-                for key in list(st.session_state.keys()):
-                    if key != 'app_mode':
-                        del st.session_state[key]
+                # The mode radio has already rendered, so keep its key
+                for key in st.session_state.keys() - {'app_mode'}:
+                    del st.session_state[key]
                 st.rerun()
     
     # Route based on mode
@@ -1155,19 +960,8 @@ def main():
         show_teacher_dashboard()
     else:
         # Student practice flow
-        if 'phase' not in st.session_state:
-            st.session_state.phase = 'welcome'
-        
-        if st.session_state.phase == 'welcome':
-            show_student_welcome()
-        elif st.session_state.phase == 'typed':
-            show_typed_questions()
-        elif st.session_state.phase == 'video_intro':
-            show_video_intro()
-        elif st.session_state.phase == 'video':
-            show_video_questions()
-        elif st.session_state.phase == 'complete':
-            show_completion()
+        phase = st.session_state.setdefault('phase', 'welcome')
+        _PHASE_HANDLERS.get(phase, show_student_welcome)()
 
 
 if __name__ == "__main__":